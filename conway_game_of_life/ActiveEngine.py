@@ -0,0 +1,95 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the ActiveEngine class, which only re-evaluates the cells
+that changed in the previous step and their neighbours. Cells in stable or
+empty parts of the grid are skipped, so the cost of a step scales with the
+activity on the grid rather than its area.
+"""
+
+class ActiveEngine:
+    def __init__(self, initial_state: list[bool], grid_dimensions: tuple[int]) -> None:
+        """
+        INPUTS:
+            + initial_state (list[bool]) -> The flattened initial state of the grid, in the
+                                            same row-by-row layout used by Game
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                                (number_of_columns, number_of_rows)
+        """
+        self.grid_dimensions = grid_dimensions
+        # Cells use the same flattened grid index as Game.initialise_grid
+        self.state = bytearray(1 if cell_state else 0 for cell_state in initial_state)
+        self.num_neighbours = bytearray(len(self.state))
+        
+        self.active_cells = set() # Grid indices which must be re-evaluated next step
+        self.last_active_region_size = 0 # Number of cells re-evaluated by the last step
+        
+        # Count neighbours of the initial state from the live cells outwards
+        for cell_index, cell_state in enumerate(self.state):
+            if cell_state:
+                self.active_cells.add(cell_index)
+                for neighbour_index in self._neighbour_indices(cell_index):
+                    self.num_neighbours[neighbour_index] += 1
+                    self.active_cells.add(neighbour_index)
+                    
+    def _neighbour_indices(self, cell_index: int) -> list[int]:
+        """
+        Returns the grid indices of the neighbours of a cell. Edges are not periodic.
+        """
+        x_coord = cell_index % self.grid_dimensions[0]
+        y_coord = cell_index // self.grid_dimensions[0]
+        neighbours = []
+        for dy in [-1,0,1]:
+            if y_coord + dy < 0 or y_coord + dy >= self.grid_dimensions[1]:
+                continue
+            for dx in [-1,0,1]:
+                if x_coord + dx < 0 or x_coord + dx >= self.grid_dimensions[0]:
+                    continue
+                if dx == 0 and dy == 0:
+                    continue
+                neighbours.append(cell_index + dx + dy * self.grid_dimensions[0])
+        return neighbours
+        
+    def get_state(self) -> list[bool]:
+        """
+        This function returns the flattened alive(True)/dead(False) states of the grid.
+        """
+        return [cell_state == 1 for cell_state in self.state]
+    
+    @property
+    def active_region_size(self) -> int:
+        """
+        The number of cells which will be re-evaluated at the next step.
+        """
+        return len(self.active_cells)
+    
+    def count_neighbours(self) -> None:
+        """
+        Neighbour counts are kept up to date as cells change in update_grid,
+        so there is nothing to do here.
+        """
+        
+    def update_grid(self) -> None:
+        """
+        This function applies the birth/survival rules to the active cells only,
+        then updates the neighbour counts around any cell which changed.
+        """
+        self.last_active_region_size = len(self.active_cells)
+        
+        # Find every change before applying any, as all cells update at once
+        changed_cells = []
+        for cell_index in self.active_cells:
+            num_neighbours = self.num_neighbours[cell_index]
+            alive = num_neighbours == 3 or (num_neighbours == 2 and self.state[cell_index] == 1)
+            if alive != (self.state[cell_index] == 1):
+                changed_cells.append(cell_index)
+        
+        # Apply changes and mark them and their neighbours as active for the next step
+        self.active_cells = set()
+        for cell_index in changed_cells:
+            self.state[cell_index] ^= 1
+            difference = 1 if self.state[cell_index] == 1 else -1
+            self.active_cells.add(cell_index)
+            for neighbour_index in self._neighbour_indices(cell_index):
+                self.num_neighbours[neighbour_index] += difference
+                self.active_cells.add(neighbour_index)
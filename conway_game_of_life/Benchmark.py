@@ -0,0 +1,143 @@
+"""
+Date of creation: 17/10/26
+
+This file runs standard workloads through the game engines and writes the
+results as JSON, so that changes to the engines can be checked for speed
+regressions. Run it from this directory, for example
+
+    python Benchmark.py --engines numpy bitboard --sizes 256 1024 --steps 100
+
+Each result holds the cells processed per second, the peak memory traced
+while running, and the total time spent in each phase of a step.
+"""
+import argparse
+import json
+import platform
+import tracemalloc
+from time import perf_counter
+import matplotlib
+import numpy as np
+# Game imports Display and so pyplot, so the non-interactive backend must be chosen first
+matplotlib.use("Agg")
+from Game import Game
+from Display import Display
+from Presets import Presets
+
+GLIDER = np.array([[0,1,0],
+                   [0,0,1],
+                   [1,1,1]], dtype=bool)
+
+#* >>> Workloads, each returns a flattened initial state for a size x size grid <<<
+def random_soup(size: int, density: float, seed: int = 0) -> list[bool]:
+    rng = np.random.default_rng(seed)
+    return (rng.random(size * size) < density).tolist()
+
+def tiled_pulsar(size: int) -> list[bool]:
+    preset = Presets("pulsar_single")
+    tile = np.array(preset.initial_state, dtype=bool).reshape((preset.grid_dimensions[1], preset.grid_dimensions[0]))
+    repeats = -(-size // tile.shape[0])
+    return np.tile(tile, (repeats, repeats))[:size, :size].ravel().tolist()
+
+def sparse_gliders(size: int, spacing: int = 32) -> list[bool]:
+    grid = np.zeros((size, size), dtype=bool)
+    for y in range(0, size - GLIDER.shape[0], spacing):
+        for x in range(0, size - GLIDER.shape[1], spacing):
+            grid[y:y + GLIDER.shape[0], x:x + GLIDER.shape[1]] = GLIDER
+    return grid.ravel().tolist()
+
+WORKLOADS = {
+    "soup_0.1": lambda size: random_soup(size, 0.1),
+    "soup_0.3": lambda size: random_soup(size, 0.3),
+    "soup_0.5": lambda size: random_soup(size, 0.5),
+    "pulsar_tiled": tiled_pulsar,
+    "sparse_gliders": sparse_gliders,
+}
+
+#* >>> Runs a game for a number of steps, timing each phase <<<
+def _run_steps(initial_state: list[bool], engine: str, size: int, number_of_steps: int,
+               keep_states: bool) -> tuple:
+    phase_times = {"setup": 0.0, "count_neighbours": 0.0, "update_grid": 0.0, "get_state": 0.0}
+    start_time = perf_counter()
+    game = Game(initial_state, (size, size), engine=engine)
+    phase_times["setup"] = perf_counter() - start_time
+    
+    populations = []
+    states = []
+    for _ in range(number_of_steps):
+        step_times = game.timed_step()
+        for phase, phase_time in step_times.items():
+            phase_times[phase] += phase_time
+        state_start = perf_counter()
+        state = game.get_state()
+        phase_times["get_state"] += perf_counter() - state_start
+        populations.append(int(sum(state)))
+        if keep_states:
+            states.append(state)
+            
+    if hasattr(game.engine, "close"):
+        game.engine.close()
+    return phase_times, populations, states
+
+def run_workload(workload: str, engine: str, size: int, number_of_steps: int,
+                 time_display: bool = False) -> dict:
+    """
+    INPUTS:
+        + workload (str) -> The name of a workload in WORKLOADS
+        + engine (str) -> The engine passed to Game
+        + size (int) -> The number of rows and columns of the grid
+        + number_of_steps (int) -> How many steps to run
+        + time_display (bool) -> If true then Display.draw_frame is also timed for every step
+    RETURNS:
+        + The benchmark result
+    """
+    initial_state = WORKLOADS[workload](size)
+    
+    # Tracing allocations slows engines which create many Python objects far more than
+    #  the others, so the steps are timed in one run and the peak memory found in another
+    phase_times, populations, states = _run_steps(initial_state, engine, size, number_of_steps, time_display)
+    step_time = phase_times["count_neighbours"] + phase_times["update_grid"]
+    tracemalloc.start()
+    _run_steps(initial_state, engine, size, number_of_steps, False)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    if time_display:
+        display = Display((size, size))
+        display_start = perf_counter()
+        for frame in range(len(states)):
+            Display.draw_frame(frame, states, display.grid_dimensions, display.image)
+        phase_times["draw_frame"] = perf_counter() - display_start
+    
+    return {"workload": workload, "engine": engine, "size": size, "steps": number_of_steps,
+            "cells_per_second": size * size * number_of_steps / step_time if step_time > 0 else None,
+            "peak_memory_bytes": peak_memory, "phase_seconds": phase_times,
+            "final_population": populations[-1] if populations else int(sum(initial_state))}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Game of Life engines.")
+    parser.add_argument("--engines", nargs="+", default=["cell", "numpy", "bitboard", "active"])
+    parser.add_argument("--workloads", nargs="+", default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[64, 256])
+    parser.add_argument("--steps", nargs="+", type=int, default=[10])
+    parser.add_argument("--display", action="store_true", help="Also time Display.draw_frame")
+    parser.add_argument("--output", default="benchmark_results.json")
+    arguments = parser.parse_args()
+    
+    results = []
+    for workload in arguments.workloads:
+        for size in arguments.sizes:
+            for number_of_steps in arguments.steps:
+                for engine in arguments.engines:
+                    result = run_workload(workload, engine, size, number_of_steps, arguments.display)
+                    results.append(result)
+                    print(f"{workload:>15} {engine:>9} {size:>6} {number_of_steps:>6} "
+                          f"{result['cells_per_second'] or 0:>14.3e} cells/s "
+                          f"{result['peak_memory_bytes'] / 2**20:>9.1f} MiB")
+                    
+    with open(arguments.output, "w") as output_file:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                   "results": results}, output_file, indent=2)
+    print(f"Results written to {arguments.output}")
+    
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the BitboardEngine class, which stores the game grid
+bit-packed with 64 cells per uint64 word. Neighbour counts are found with
+bitwise full-adder logic so that 64 cells are counted in every operation.
+"""
+import numpy as np
+
+WORD_BITS = 64
+ONE = np.uint64(1)
+TOP_BIT = np.uint64(WORD_BITS - 1)
+
+def pack_rows(state: list[bool], grid_dimensions: tuple[int]) -> np.ndarray:
+    """
+    INPUTS:
+        + state (list[bool]) -> The flattened grid state in the Game layout
+        + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                            (number_of_columns, number_of_rows)
+    RETURNS:
+        + A (number_of_rows, words_per_row) uint64 array where cell x of a row is
+            held in bit x % 64 of word x // 64
+    """
+    columns, rows = grid_dimensions
+    words_per_row = (columns + WORD_BITS - 1) // WORD_BITS
+    bits = np.zeros((rows, words_per_row * WORD_BITS), dtype=np.uint8)
+    bits[:, :columns] = np.asarray(state, dtype=np.uint8).reshape((rows, columns))
+    packed = np.packbits(bits, axis=1, bitorder="little")
+    return packed.view(np.dtype("<u8")).astype(np.uint64)
+
+def unpack_rows(board: np.ndarray, grid_dimensions: tuple[int]) -> list[bool]:
+    """
+    INPUTS:
+        + board (np.ndarray) -> A bit-packed board as returned by pack_rows
+        + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                            (number_of_columns, number_of_rows)
+    RETURNS:
+        + The flattened grid state in the Game layout
+    """
+    columns = grid_dimensions[0]
+    packed = np.ascontiguousarray(board, dtype=np.dtype("<u8")).view(np.uint8)
+    bits = np.unpackbits(packed, axis=1, bitorder="little")[:, :columns]
+    return bits.ravel().astype(bool).tolist()
+
+def _half_add(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray]:
+    return a ^ b, a & b
+
+def _full_add(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> tuple[np.ndarray]:
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+class BitboardEngine:
+    def __init__(self, initial_state: list[bool], grid_dimensions: tuple[int]) -> None:
+        """
+        INPUTS:
+            + initial_state (list[bool]) -> The flattened initial state of the grid, in the
+                                            same row-by-row layout used by Game
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                                (number_of_columns, number_of_rows)
+        """
+        self.grid_dimensions = grid_dimensions
+        self.board = pack_rows(initial_state, grid_dimensions)
+        
+        # Mask of the bits in each word which hold real cells, the rest are kept dead
+        columns = grid_dimensions[0]
+        self.row_mask = np.full(self.board.shape[1], np.iinfo(np.uint64).max, dtype=np.uint64)
+        if columns % WORD_BITS != 0:
+            self.row_mask[-1] = (ONE << np.uint64(columns % WORD_BITS)) - ONE
+        
+        # Bit-sliced neighbour counts, filled by count_neighbours
+        self.count_ones = None
+        self.count_twos = None
+        self.count_fours = None
+        
+    def get_state(self) -> list[bool]:
+        """
+        This function returns the flattened alive(True)/dead(False) states of the grid.
+        """
+        return unpack_rows(self.board, self.grid_dimensions)
+    
+    @staticmethod
+    def _shift_west(board: np.ndarray) -> np.ndarray:
+        """
+        Moves every cell one column to the right, so each cell lines up with its
+        western neighbour. Bits carry across word boundaries within a row.
+        """
+        shifted = board << ONE
+        shifted[:, 1:] |= board[:, :-1] >> TOP_BIT
+        return shifted
+    
+    @staticmethod
+    def _shift_east(board: np.ndarray) -> np.ndarray:
+        """
+        Moves every cell one column to the left, so each cell lines up with its
+        eastern neighbour. Bits carry across word boundaries within a row.
+        """
+        shifted = board >> ONE
+        shifted[:, :-1] |= board[:, 1:] << TOP_BIT
+        return shifted
+    
+    def count_neighbours(self) -> None:
+        """
+        This function counts the neighbours of every cell as three bit-planes using
+        full adders. Rows above and below the board are dead so edges are not periodic.
+        """
+        west = self._shift_west(self.board)
+        east = self._shift_east(self.board)
+        
+        # Count the three cells in each row, weights 1 and 2
+        row_ones, row_twos = _full_add(west, self.board, east)
+        
+        # Line up the row sums of the rows above and below each cell
+        above_ones = np.zeros_like(row_ones)
+        above_twos = np.zeros_like(row_twos)
+        above_ones[1:] = row_ones[:-1]
+        above_twos[1:] = row_twos[:-1]
+        below_ones = np.zeros_like(row_ones)
+        below_twos = np.zeros_like(row_twos)
+        below_ones[:-1] = row_ones[1:]
+        below_twos[:-1] = row_twos[1:]
+        
+        # The cell's own row only contributes its west and east neighbours
+        middle_ones, middle_twos = _half_add(west, east)
+        
+        # Sum the weight 1 bits, then the weight 2 bits and their carries
+        self.count_ones, carry_twos = _full_add(above_ones, below_ones, middle_ones)
+        twos, fours = _full_add(above_twos, below_twos, middle_twos)
+        self.count_twos, carry_fours = _half_add(twos, carry_twos)
+        # Any bit of weight 4 or more means the cell has too many neighbours
+        self.count_fours = fours | carry_fours
+        
+    def update_grid(self) -> None:
+        """
+        This function applies the birth/survival rules to every word at once. A cell is
+        alive next step if it has 3 neighbours, or 2 neighbours and is already alive.
+        """
+        alive = self.count_twos & ~self.count_fours & (self.count_ones | self.board)
+        self.board = alive & self.row_mask
@@ -0,0 +1,55 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the CycleDetector class, which spots when the game returns
+to a state it has already been in, for example a still life or an oscillator.
+Each state is hashed by XOR-ing a random key for every live cell (Zobrist
+hashing), so the hash is updated using only the cells which changed.
+"""
+from collections import OrderedDict
+import numpy as np
+
+class CycleDetector:
+    def __init__(self, number_of_cells: int, table_size: int = 4096, seed: int = 0) -> None:
+        """
+        INPUTS:
+            + number_of_cells (int) -> The number of cells in the game grid
+            + table_size (int) -> The number of recent state hashes to remember. Cycles
+                                    longer than this are not detected.
+            + seed (int) -> Seed for the random cell keys
+        """
+        rng = np.random.default_rng(seed)
+        self.cell_keys = rng.integers(0, np.iinfo(np.uint64).max, size=number_of_cells,
+                                      dtype=np.uint64, endpoint=True)
+        self.table_size = table_size
+        self.recent_hashes = OrderedDict() # State hash -> generation it was seen at
+        
+        self.previous_state = None
+        self.state_hash = np.uint64(0)
+        
+    def observe(self, grid_state: list[bool], generation: int) -> tuple[int] | None:
+        """
+        INPUTS:
+            + grid_state (list[bool]) -> The flattened grid state at this generation
+            + generation (int) -> The generation number of the state
+        RETURNS:
+            + (start_generation, period) if the state was seen before, otherwise None.
+                The cycle starts at start_generation and repeats every period generations.
+        """
+        state = np.asarray(grid_state, dtype=bool)
+        if self.previous_state is None:
+            changed = state
+        else:
+            changed = state != self.previous_state
+        self.state_hash ^= np.bitwise_xor.reduce(self.cell_keys[changed])
+        self.previous_state = state
+        
+        key = int(self.state_hash)
+        if key in self.recent_hashes:
+            start_generation = self.recent_hashes[key]
+            return (start_generation, generation - start_generation)
+        
+        self.recent_hashes[key] = generation
+        if len(self.recent_hashes) > self.table_size:
+            self.recent_hashes.popitem(last=False)
+        return None
@@ -7,6 +7,9 @@ the displaying of the grid using matplotlib
 and numpy
 """
 from Cell import Cell
+from queue import Queue, Empty, Full
+from threading import Event, Thread
+from typing import Iterator
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
@@ -61,4 +64,73 @@ class Display:
         animation = FuncAnimation(self.fig, self.draw_frame, frames=np.arange(len(grid_state_history)),
                                   fargs=(grid_state_history, self.grid_dimensions, self.image),
                                   interval=300)
-        plt.show()
\ No newline at end of file
+        plt.show()
+        
+    # This will show the game as it is simulated, without storing every timestep
+    def stream_game(self, grid_states: Iterator[list[int]], queue_size: int = 4, interval: int = 300) -> None:
+        """
+        INPUTS:
+            + grid_states (Iterator[list[int]]) -> Yields the game state at each timestep,
+                                                    for example Game.stream_states
+            + queue_size (int) -> The number of simulated frames which can wait to be drawn
+            + interval (int) -> The time between drawn frames in milliseconds
+        """
+        frame_queue = Queue(maxsize=queue_size)
+        stop = Event()
+        
+        # Simulate in a separate thread so the simulation and drawing overlap
+        def produce():
+            for grid_state in grid_states:
+                while not stop.is_set():
+                    try:
+                        frame_queue.put(grid_state, timeout=0.1)
+                        break
+                    except Full:
+                        continue
+                if stop.is_set():
+                    return
+            frame_queue.put(None) # Marks the end of the game
+        
+        producer = Thread(target=produce, daemon=True)
+        producer.start()
+        
+        animation = FuncAnimation(self.fig, self.draw_latest_frame, frames=None,
+                                  fargs=(frame_queue, self.grid_dimensions, self.image_array, self.image),
+                                  interval=interval, blit=True, cache_frame_data=False)
+        plt.show()
+        stop.set()
+        
+    # This updates the display to show the newest simulated frame, dropping any older ones
+    @staticmethod
+    def draw_latest_frame(frame, frame_queue: Queue, grid_dimensions: tuple[int],
+                          image_array: np.ndarray, image):
+        """
+        INPUTS:
+            + frame_queue (Queue) -> Queue of game states waiting to be drawn, None marks
+                                        the end of the game
+            + grid_dimensions (tuple(int)) -> The dimensions of the 2D grid
+            + image_array (np.ndarray) -> The image buffer, which is updated in place
+            + image (matpltlib imshow object) -> The matplotlib image to draw frame on
+        """
+        # Take everything waiting, only the newest state is drawn if rendering is behind
+        grid_state = None
+        finished = False
+        while True:
+            try:
+                queued_state = frame_queue.get_nowait()
+            except Empty:
+                break
+            if queued_state is None:
+                finished = True
+                break
+            grid_state = queued_state
+            
+        if grid_state is not None:
+            np.copyto(image_array, np.asarray(grid_state).reshape(grid_dimensions))
+            image.set_data(image_array)
+            
+        # Close display if animation is finished
+        if finished:
+            plt.close()
+        
+        return (image,)
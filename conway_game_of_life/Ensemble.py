@@ -0,0 +1,87 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the Ensemble class, which evolves many games of the same
+grid dimensions at once. All grids are held in one 3-d array with axes
+(board, row, column) and every board is stepped in the same array operation.
+"""
+import numpy as np
+from NumpyEngine import count_padded_neighbours, apply_rules
+
+class Ensemble:
+    def __init__(self, initial_states: list[list[bool]] | np.ndarray, grid_dimensions: tuple[int]) -> None:
+        """
+        INPUTS:
+            + initial_states (list[list[bool]]) -> The flattened initial state of every board,
+                                                    each in the same row-by-row layout used by Game
+            + grid_dimensions (tuple(int)) -> The dimensions shared by every grid as
+                                                (number_of_columns, number_of_rows)
+        """
+        self.grid_dimensions = grid_dimensions
+        columns, rows = grid_dimensions
+        self.boards = np.asarray(initial_states, dtype=np.uint8).reshape((-1, rows, columns))
+        self.number_of_boards = self.boards.shape[0]
+        
+        # Step at which each board died or became a still life, -1 while still changing
+        self.finished_at = np.full(self.number_of_boards, -1, dtype=np.int64)
+        
+    @staticmethod
+    def _step(boards: np.ndarray) -> np.ndarray:
+        """
+        Returns the boards one step later. Each board is surrounded by dead ghost
+        cells, so edges are not periodic and boards do not affect each other.
+        """
+        padded = np.pad(boards, ((0,0), (1,1), (1,1)))
+        return apply_rules(boards, count_padded_neighbours(padded))
+    
+    def populations(self) -> np.ndarray:
+        """
+        Returns the number of live cells on each board.
+        """
+        return self.boards.sum(axis=(1,2), dtype=np.int64)
+    
+    def get_states(self) -> np.ndarray:
+        """
+        Returns the flattened state of every board as a (number_of_boards, number_of_cells)
+        bool array, each row in the Game layout.
+        """
+        return self.boards.reshape((self.number_of_boards, -1)).astype(bool)
+    
+    def run(self, number_of_steps: int, stop_finished: bool = False) -> tuple[np.ndarray]:
+        """
+        INPUTS:
+            + number_of_steps (int) -> How many steps to run every board for
+            + stop_finished (bool) -> If true, boards which have died or become still
+                                        lifes are no longer stepped. Their step in this
+                                        run is saved in self.finished_at, which is reset
+                                        at the start of every run.
+        RETURNS:
+            + A (number_of_steps + 1, number_of_boards) array of the population of
+                each board at each step, starting with the initial state
+            + The final states, as returned by get_states
+        """
+        populations = np.zeros((number_of_steps + 1, self.number_of_boards), dtype=np.int64)
+        populations[0] = self.populations()
+        # Steps are counted from the start of this run, so results of an earlier run are cleared
+        self.finished_at[:] = -1
+        active = np.ones(self.number_of_boards, dtype=bool)
+        
+        for step in range(1, number_of_steps + 1):
+            if stop_finished:
+                if not active.any():
+                    populations[step:] = populations[step - 1]
+                    break
+                active_boards = self.boards[active]
+                new_boards = self._step(active_boards)
+                self.boards[active] = new_boards
+                
+                # Stop boards which did not change, this includes boards which have died
+                unchanged = (new_boards == active_boards).all(axis=(1,2))
+                active_indices = np.flatnonzero(active)
+                self.finished_at[active_indices[unchanged]] = step - 1
+                active[active_indices[unchanged]] = False
+            else:
+                self.boards = self._step(self.boards)
+            populations[step] = self.populations()
+            
+        return populations, self.get_states()
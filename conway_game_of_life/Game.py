@@ -8,10 +8,21 @@ running and ending the game.
 from Cell import Cell
 from Display import Display
 from Presets import Presets
-from time import sleep
+from NumpyEngine import NumpyEngine
+from BitboardEngine import BitboardEngine
+from HashLifeEngine import HashLifeEngine
+from ActiveEngine import ActiveEngine
+from ParallelEngine import ParallelEngine
+from History import History
+from TerminalRenderer import TerminalRenderer
+from CycleDetector import CycleDetector
+from time import perf_counter
 
 class Game:
-    def __init__(self, initial_state: list[bool] | str, grid_dimensions: tuple[int] | None)->None:
+    def __init__(self, initial_state: list[bool] | str, grid_dimensions: tuple[int] | None,
+                 engine: str = "cell", number_of_workers: int | None = None,
+                 history: History | None = None, pattern_offset: tuple[int] = (0,0),
+                 pattern_padding: int = 0, pattern_cache_directory: str | None = None)->None:
         """
         -- INPUTS --
         
@@ -41,38 +52,92 @@ class Game:
                                 with grid dimensions of (3,4).
                                     
                       --> str: can be one of the following presets,
-                                + pulsar
+                                + pulsar_single
+                                or the path to a .rle or .cells pattern file.
                                 
                                 Grid dimensions are not needed in the preset case,
-                                you should pass None.
+                                you can pass None. For a pattern file they may be given
+                                to place the pattern in a larger grid.
                                 
         grid_dimensions --> tuple(int): A two-element tuple defining the dimensions
                                         of the grid as (number_of_columns, number_of_rows).
                                         Please see example in initial_state documentation.
                                         
                         --> None: If you have initialised the grid with a preset then you
-                                  should pass grid_dimensions as None as they will be ignored.
+                                  can pass grid_dimensions as None. Named presets ignore the
+                                  dimensions, and pattern files are given a grid just large enough.
+                                  
+        engine --> str: The engine used to step the game, can be one of the following,
+                        + cell  -> Every cell is a Cell object updated one at a time (default)
+                        + numpy -> The grid is a 2-d numpy array updated all at once
+                        + bitboard -> The grid is bit-packed 64 cells per word and
+                                      updated with bitwise logic
+                        + hashlife -> The grid is a memoized quadtree which can be
+                                      advanced many generations at once, see advance
+                        + active -> Only cells which changed last step and their
+                                    neighbours are re-evaluated each step
+                        + parallel -> The grid is split into strips which are stepped
+                                      by worker processes sharing memory
+                                      
+        number_of_workers --> int: The number of worker processes used by the parallel engine,
+                                   defaults to the number of cores. Ignored by other engines.
+                                   
+        history --> History: Records the grid state at each timestep in a compressed, on-disk
+                             or ring buffer format, see History.py
+                --> None: The grid states are stored as a list of bools per timestep (default)
+                
+        pattern_offset --> tuple(int): The (x,y) position of a pattern file within the grid
+        
+        pattern_padding --> int: Number of dead cells to leave around a pattern file
+        
+        pattern_cache_directory --> str: A directory where parsed pattern files are cached, so
+                                         loading the same file again is instant
+                                --> None: Pattern files are not cached (default)
         """
         
         # Check user has passed correct types
-        if type(initial_state) == str and grid_dimensions is not None:
-            grid_dimensions = None
         if type(initial_state) == list and grid_dimensions is None:
             print("You must specify the dimensions of the game grid! Exiting...")
             exit(1)
             
         # Set initial state
         if type(initial_state) == str:
-            preset = Presets(initial_state)
+            preset = Presets(initial_state, pattern_offset, pattern_padding, grid_dimensions,
+                             pattern_cache_directory)
             self.initial_state = preset.initial_state
             self.grid_dimensions = preset.grid_dimensions
         else:
             self.grid_dimensions = grid_dimensions
             self.initial_state = initial_state
         
-        self.grid = self.initialise_grid()
+        # Set up the engine which steps the game
+        if engine == "cell":
+            self.engine = None
+            self.grid = self.initialise_grid()
+        elif engine == "numpy":
+            self.engine = NumpyEngine(self.initial_state, self.grid_dimensions)
+            self.grid = None
+        elif engine == "bitboard":
+            self.engine = BitboardEngine(self.initial_state, self.grid_dimensions)
+            self.grid = None
+        elif engine == "hashlife":
+            self.engine = HashLifeEngine(self.initial_state, self.grid_dimensions)
+            self.grid = None
+        elif engine == "active":
+            self.engine = ActiveEngine(self.initial_state, self.grid_dimensions)
+            self.grid = None
+        elif engine == "parallel":
+            self.engine = ParallelEngine(self.initial_state, self.grid_dimensions, number_of_workers)
+            self.grid = None
+        else:
+            print(f"Engine {engine} not recognised! Exiting...")
+            exit(1)
+        
+        # This will store the grid state at each timestep for animation
+        self.grid_states = history if history is not None else []
         
-        self.grid_states = [] # This will store the grid state at each timestep for animation
+        self.cycle = None # (start_generation, period) once play detects a repeating state
+        self.step_records = [] # Per-step timings and population when play records steps
         
     def initialise_grid(self) -> list[Cell]:
         """
@@ -92,6 +157,8 @@ class Game:
         This function will convert the grid of cells into a grid of
         alive(1)/dead(0) states. This is used for plotting.
         """
+        if self.engine is not None:
+            return self.engine.get_state()
         return [cell.state for cell in self.grid]
     
     def count_neighbours(self):
@@ -99,6 +166,10 @@ class Game:
         This function counts the number of neighbours each cell has. It is crucial
         to do this each timestep before updating the cell's state.
         """
+        if self.engine is not None:
+            self.engine.count_neighbours()
+            return
+        
         # Loop over every cell in the grid
         for cell in self.grid:
             cell_index = cell.grid_index
@@ -136,10 +207,54 @@ class Game:
             cell.set_neighbours(num_neighbours)
         
     def update_grid(self):
+        if self.engine is not None:
+            self.engine.update_grid()
+            return
+        
         for cell in self.grid:
             cell.update_state()
             
-    def play(self, number_of_steps, in_terminal=False):
+    def advance(self, number_of_steps: int) -> list[bool]:
+        """
+        This function moves the game forward by the given number of steps without
+        displaying it, and returns the resulting state in the same layout as get_state.
+        Engines with their own advance method (hashlife, parallel) move forward in a
+        single call, the other engines step one generation at a time.
+        """
+        if self.engine is not None and hasattr(self.engine, "advance"):
+            self.engine.advance(number_of_steps)
+        else:
+            for _ in range(number_of_steps):
+                self.count_neighbours()
+                self.update_grid()
+        return self.get_state()
+            
+    def timed_step(self) -> dict:
+        """
+        This function advances the game by one step, timing each phase.
+        Returns the time in seconds spent counting neighbours and updating the grid.
+        """
+        start_time = perf_counter()
+        self.count_neighbours()
+        neighbours_time = perf_counter()
+        self.update_grid()
+        update_time = perf_counter()
+        return {"count_neighbours": neighbours_time - start_time,
+                "update_grid": update_time - neighbours_time}
+    
+    def stream_states(self, number_of_steps: int):
+        """
+        This generator yields the initial state followed by the state after each
+        step, simulating each one only when it is asked for.
+        """
+        yield self.get_state()
+        for _ in range(number_of_steps):
+            self.count_neighbours()
+            self.update_grid()
+            yield self.get_state()
+            
+    def play(self, number_of_steps, in_terminal=False, stream=False, frames_per_second=5,
+             on_cycle=None, record_steps=False):
         """
         INPUTS:
             + number_of_steps (int) -> How many steps you want the
@@ -147,33 +262,96 @@ class Game:
             + in_terminal (bool) -> If true then the game will be
                                     displayed in the terminal rather
                                     than using matplotlib
+            + stream (bool) -> If true then the matplotlib animation is
+                                drawn while the game is simulated, and
+                                the grid states are only stored if a
+                                History was given
+            + frames_per_second (float) -> The target frame rate when
+                                            displaying in the terminal
+            + on_cycle (str) -> What to do when the game repeats a previous
+                                state, the cycle is saved in self.cycle
+                                    + None -> Cycles are not looked for (default)
+                                    + stop -> Stop the game at the repeat
+                                    + skip -> Skip whole cycles and only run the
+                                                steps left over to reach number_of_steps
+            + record_steps (bool) -> If true then the time spent in each phase
+                                        and the population at every step are
+                                        saved in self.step_records, along with
+                                        the number of cells re-evaluated when
+                                        using the active engine
         """
-        step = 0
-        # Show the game board in its initial state
+        # A supplied history records the states even when they are streamed
+        store_states = not in_terminal and (not stream or isinstance(self.grid_states, History))
+        states = self._play_states(number_of_steps, on_cycle, record_steps, store_states)
+        
         if in_terminal:
-            print(self)
-            sleep(0.2)
+            renderer = TerminalRenderer(self.grid_dimensions, frames_per_second)
+            for state in states:
+                renderer.draw(state)
+        elif stream:
+            # Draw the game as it is simulated
+            display = Display(self.grid_dimensions)
+            display.stream_game(states)
         else:
-            self.grid_states.append(self.get_state())
+            for _ in states:
+                pass
+            # Show animation for the grid's evolution
+            display = Display(self.grid_dimensions)
+            display.animate_game(self.grid_states)
+            
+    def _play_states(self, number_of_steps, on_cycle, record_steps, store_states):
+        """
+        This generator runs the game for play, yielding the initial state followed
+        by the state after each step. Cycles are looked for and steps recorded as
+        set out in play, and each state is added to grid_states if store_states is true.
+        """
+        detector = None
+        self.cycle = None
+        if record_steps:
+            self.step_records = []
+        if on_cycle is not None:
+            detector = CycleDetector(self.grid_dimensions[0] * self.grid_dimensions[1])
+        
+        step = 0
+        # Show the game board in its initial state
+        state = self.get_state()
+        if store_states:
+            self.grid_states.append(state)
+        if detector is not None:
+            detector.observe(state, step)
+        yield state
             
         # Loop over each time step and update the game grid
         while step < number_of_steps:
-            self.count_neighbours()
-            self.update_grid()
-            
-            # Show the game board in its current state
-            if in_terminal:
-                print(self)
-                sleep(0.2)
+            if record_steps:
+                record = self.timed_step()
             else:
-                self.grid_states.append(self.get_state())
-        
+                self.count_neighbours()
+                self.update_grid()
             step += 1
             
-        # Show animation for the grid's evolution
-        if not in_terminal:
-            display = Display(self.grid_dimensions)
-            display.animate_game(self.grid_states)
+            # Show the game board in its current state
+            state = self.get_state()
+            if record_steps:
+                record["step"] = step
+                record["population"] = int(sum(state))
+                if isinstance(self.engine, ActiveEngine):
+                    record["active_region_size"] = self.engine.last_active_region_size
+                self.step_records.append(record)
+            if store_states:
+                self.grid_states.append(state)
+            yield state
+                
+            # Check whether the game has returned to an earlier state
+            if detector is not None and self.cycle is None:
+                self.cycle = detector.observe(state, step)
+                if self.cycle is not None:
+                    start_generation, period = self.cycle
+                    print(f"Game repeats every {period} steps from step {start_generation}.")
+                    if on_cycle == "stop":
+                        break
+                    # Whole cycles leave the grid unchanged, so only the remainder is run
+                    number_of_steps = step + (number_of_steps - step) % period
             
     def display(self):
         """
@@ -186,13 +364,13 @@ class Game:
         It will display the grid in the terminal, with alive cells marked by x's,
         and dead cells marked by -'s. Returns the string to be displayed.
         """
-        grid_string = ""
-        for _index in range(self.grid_dimensions[0] * self.grid_dimensions[1]):
-            if _index % self.grid_dimensions[0] == 0:
-                grid_string += "\n"
-            grid_string += "x" if self.grid[_index].state == True else "-"
-        grid_string += "\n"
-        return grid_string
+        state = self.get_state()
+        number_of_columns = self.grid_dimensions[0]
+        rows = []
+        for row_start in range(0, number_of_columns * self.grid_dimensions[1], number_of_columns):
+            rows.append("".join("x" if cell_state == True else "-"
+                                for cell_state in state[row_start:row_start + number_of_columns]))
+        return "\n" + "\n".join(rows) + "\n"
         
 if __name__ == "__main__":
     
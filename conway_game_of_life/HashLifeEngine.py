@@ -0,0 +1,255 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the HashLifeEngine class, which stores the game grid as a
+memoized quadtree of canonical nodes. Identical regions of the grid share
+a single node, and the future of each node is cached, which lets the engine
+skip forward by huge numbers of generations at once.
+
+Cells outside the game grid are held as "blocked" cells which never come
+alive, so the grid edges behave exactly as in the other engines.
+"""
+import numpy as np
+
+DEAD = 0
+ALIVE = 1
+BLOCKED = 2
+
+class QuadNode:
+    """
+    A square region of 2^level x 2^level cells. Level 0 nodes are single cells,
+    every other node is made of four child nodes one level down.
+    """
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population", "state")
+    
+    def __init__(self, level: int, nw=None, ne=None, sw=None, se=None, state: int = DEAD) -> None:
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.state = state # Only used by level 0 nodes
+        if level == 0:
+            self.population = 1 if state == ALIVE else 0
+        else:
+            self.population = nw.population + ne.population + sw.population + se.population
+
+class HashLifeEngine:
+    def __init__(self, initial_state: list[bool], grid_dimensions: tuple[int],
+                 max_nodes: int = 2_000_000) -> None:
+        """
+        INPUTS:
+            + initial_state (list[bool]) -> The flattened initial state of the grid, in the
+                                            same row-by-row layout used by Game
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                                (number_of_columns, number_of_rows)
+            + max_nodes (int) -> The number of canonical nodes held before the caches are
+                                    cleared of everything not needed by the current grid.
+                                    This is checked between steps, so a single step may
+                                    go over it.
+        """
+        self.grid_dimensions = grid_dimensions
+        self.max_nodes = max_nodes
+        self.generation = 0
+        
+        self.leaves = [QuadNode(0, state=DEAD), QuadNode(0, state=ALIVE), QuadNode(0, state=BLOCKED)]
+        self.nodes = {} # Canonical nodes keyed by their four children
+        self.results = {} # Cached futures keyed by (node, log2 of generations)
+        self.blocked_nodes = [self.leaves[BLOCKED]] # Fully blocked node of each level
+        
+        # Build the smallest root which covers the grid, with the grid in its top left
+        columns, rows = grid_dimensions
+        level = 1
+        while 2**level < max(columns, rows):
+            level += 1
+        board = np.asarray(initial_state, dtype=bool).reshape((rows, columns))
+        self.root = self._build(board, 0, 0, level)
+        
+    #* >>> Node construction <<<
+    def _join(self, nw: QuadNode, ne: QuadNode, sw: QuadNode, se: QuadNode) -> QuadNode:
+        """
+        Returns the canonical node with the given children, creating it if needed.
+        """
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+        if node is None:
+            node = QuadNode(nw.level + 1, nw, ne, sw, se)
+            self.nodes[key] = node
+        return node
+    
+    def _blocked(self, level: int) -> QuadNode:
+        """
+        Returns the node of the given level made up entirely of blocked cells.
+        """
+        while len(self.blocked_nodes) <= level:
+            child = self.blocked_nodes[-1]
+            self.blocked_nodes.append(self._join(child, child, child, child))
+        return self.blocked_nodes[level]
+    
+    def _build(self, board: np.ndarray, x: int, y: int, level: int) -> QuadNode:
+        """
+        Builds the node covering the 2^level square with top left corner (x, y).
+        """
+        rows, columns = board.shape
+        if x >= columns or y >= rows:
+            return self._blocked(level)
+        if level == 0:
+            return self.leaves[ALIVE if board[y, x] else DEAD]
+        half = 2**(level - 1)
+        return self._join(self._build(board, x, y, level - 1),
+                          self._build(board, x + half, y, level - 1),
+                          self._build(board, x, y + half, level - 1),
+                          self._build(board, x + half, y + half, level - 1))
+        
+    def _collect(self) -> None:
+        """
+        Evicts every cached node and result, then re-registers only the nodes
+        reachable from the current root so they stay canonical. Only called
+        between steps, when the root is the only node still in use.
+        """
+        self.results.clear()
+        self.nodes.clear()
+        self.blocked_nodes = [self.leaves[BLOCKED]]
+        
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key not in self.nodes:
+                self.nodes[key] = node
+                stack.extend(key)
+                
+    #* >>> Node evolution <<<
+    def _center(self, node: QuadNode) -> QuadNode:
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+    
+    def _step_base(self, node: QuadNode) -> QuadNode:
+        """
+        Advances the centre 2x2 cells of a 4x4 node by one generation.
+        """
+        cells = [[None]*4 for _ in range(4)]
+        for quad, (qx, qy) in [(node.nw, (0,0)), (node.ne, (2,0)), (node.sw, (0,2)), (node.se, (2,2))]:
+            for leaf, (lx, ly) in [(quad.nw, (0,0)), (quad.ne, (1,0)), (quad.sw, (0,1)), (quad.se, (1,1))]:
+                cells[qy + ly][qx + lx] = leaf.state
+        
+        new_leaves = []
+        for y in [1,2]:
+            for x in [1,2]:
+                if cells[y][x] == BLOCKED:
+                    new_leaves.append(self.leaves[BLOCKED])
+                    continue
+                num_neighbours = 0
+                for dy in [-1,0,1]:
+                    for dx in [-1,0,1]:
+                        if (dx != 0 or dy != 0) and cells[y + dy][x + dx] == ALIVE:
+                            num_neighbours += 1
+                alive = num_neighbours == 3 or (num_neighbours == 2 and cells[y][x] == ALIVE)
+                new_leaves.append(self.leaves[ALIVE if alive else DEAD])
+        return self._join(*new_leaves)
+    
+    def _step(self, node: QuadNode, log_steps: int) -> QuadNode:
+        """
+        Returns the centre half of the node advanced by 2^log_steps generations.
+        The node level must be at least log_steps + 2.
+        """
+        # With no live cells nothing can be born, so the centre stays as it is
+        if node.population == 0:
+            return self._center(node)
+        key = (node, log_steps)
+        result = self.results.get(key)
+        if result is not None:
+            return result
+        if node.level == 2:
+            result = self._step_base(node)
+            self.results[key] = result
+            return result
+        
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        # The nine overlapping sub-nodes one level down
+        sub_nodes = [[nw, self._join(nw.ne, ne.nw, nw.se, ne.sw), ne],
+                     [self._join(nw.sw, nw.se, sw.nw, sw.ne), self._center(node),
+                      self._join(ne.sw, ne.se, se.nw, se.ne)],
+                     [sw, self._join(sw.ne, se.nw, sw.se, se.sw), se]]
+        
+        # When stepping the maximum distance, each half of the time is spent in a
+        # separate phase. Otherwise the first phase just takes the centres.
+        if log_steps == node.level - 2:
+            first = [[self._step(sub, log_steps - 1) for sub in row] for row in sub_nodes]
+            second_steps = log_steps - 1
+        else:
+            first = [[self._center(sub) for sub in row] for row in sub_nodes]
+            second_steps = log_steps
+        
+        quadrants = []
+        for y in [0,1]:
+            for x in [0,1]:
+                quadrant = self._join(first[y][x], first[y][x+1], first[y+1][x], first[y+1][x+1])
+                quadrants.append(self._step(quadrant, second_steps))
+        result = self._join(*quadrants)
+        self.results[key] = result
+        return result
+    
+    def _expand(self, node: QuadNode) -> QuadNode:
+        """
+        Surrounds a node with blocked cells so that it is the centre of a node one level up.
+        """
+        border = self._blocked(node.level - 1)
+        return self._join(self._join(border, border, border, node.nw),
+                          self._join(border, border, node.ne, border),
+                          self._join(border, node.sw, border, border),
+                          self._join(node.se, border, border, border))
+    
+    def advance(self, number_of_steps: int) -> None:
+        """
+        INPUTS:
+            + number_of_steps (int) -> How many generations to move the grid forward
+        """
+        log_steps = 0
+        node_limit = self.max_nodes
+        while number_of_steps > 0:
+            if number_of_steps & 1:
+                if len(self.nodes) >= node_limit:
+                    self._collect()
+                    # If the current grid alone is near the limit, collecting before every
+                    #  step would throw away the cached futures each time, so the limit is
+                    #  raised for the rest of this call
+                    node_limit = max(self.max_nodes, 2 * len(self.nodes))
+                # The root must be large enough to step 2^log_steps generations at once.
+                #  Growing keeps the grid in the top left of the root.
+                while self.root.level < log_steps + 1:
+                    border = self._blocked(self.root.level)
+                    self.root = self._join(self.root, border, border, border)
+                self.root = self._step(self._expand(self.root), log_steps)
+                self.generation += 2**log_steps
+            number_of_steps >>= 1
+            log_steps += 1
+            
+    #* >>> Interface shared with the other engines <<<
+    def get_state(self) -> list[bool]:
+        """
+        This function returns the flattened alive(True)/dead(False) states of the grid.
+        """
+        columns, rows = self.grid_dimensions
+        board = np.zeros((rows, columns), dtype=bool)
+        stack = [(self.root, 0, 0)]
+        while stack:
+            node, x, y = stack.pop()
+            if node.population == 0 or x >= columns or y >= rows:
+                continue
+            if node.level == 0:
+                board[y, x] = True
+                continue
+            half = 2**(node.level - 1)
+            stack.extend([(node.nw, x, y), (node.ne, x + half, y),
+                          (node.sw, x, y + half), (node.se, x + half, y + half)])
+        return board.ravel().tolist()
+    
+    def count_neighbours(self) -> None:
+        """
+        Neighbours are counted while advancing, so there is nothing to do here.
+        """
+        
+    def update_grid(self) -> None:
+        self.advance(1)
@@ -0,0 +1,174 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the History class, which records the grid state at each
+timestep without keeping a full list of bools per generation. It behaves
+like the list Game used to store, so it can be appended to by Game.play and
+read frame by frame by Display.animate_game.
+
+Frames can be stored in one of three ways,
+    + delta -> keyframes every so often with zlib-compressed XOR deltas in between
+    + disk  -> bit-packed frames written to a file which is read back memory-mapped
+    + ring  -> bit-packed frames for only the most recent generations
+"""
+import os
+import zlib
+import numpy as np
+
+class History:
+    def __init__(self, grid_dimensions: tuple[int], mode: str = "delta", keyframe_interval: int = 64,
+                 path: str | None = None, capacity: int | None = None, resume: bool = False) -> None:
+        """
+        INPUTS:
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                                (number_of_columns, number_of_rows)
+            + mode (str) -> How frames are stored, one of delta, disk or ring
+            + keyframe_interval (int) -> Number of generations between full frames in delta mode
+            + path (str) -> The file frames are written to in disk mode
+            + capacity (int) -> The number of most recent generations kept in ring mode
+            + resume (bool) -> If true then disk mode carries on from the frames already in path,
+                               otherwise the file is started afresh
+        """
+        self.grid_dimensions = grid_dimensions
+        self.number_of_cells = grid_dimensions[0] * grid_dimensions[1]
+        self.frame_bytes = (self.number_of_cells + 7) // 8
+        self.mode = mode
+        self.number_of_generations = 0 # Total generations recorded, including evicted ones
+        
+        # Last frame decoded, so reading frames in order does not replay deltas
+        self._cached_generation = None
+        self._cached_frame = None
+        
+        if mode == "delta":
+            self.keyframe_interval = keyframe_interval
+            self.frames = [] # zlib-compressed keyframes and XOR deltas
+            self._previous_frame = None
+        elif mode == "disk":
+            if path is None:
+                print("A path must be given to record history on disk! Exiting...")
+                exit(1)
+            self.path = path
+            if resume and os.path.exists(path):
+                file_size = os.path.getsize(path)
+                if file_size % self.frame_bytes != 0:
+                    print(f"History file {path} does not hold whole frames of this grid size! Exiting...")
+                    exit(1)
+                self._file = open(path, "ab")
+                self.number_of_generations = file_size // self.frame_bytes
+            else:
+                self._file = open(path, "wb")
+            self._memory_map = None
+        elif mode == "ring":
+            if capacity is None or capacity < 1:
+                print("A positive capacity must be given to record history in a ring! Exiting...")
+                exit(1)
+            self.capacity = capacity
+            self.frames = np.zeros((capacity, self.frame_bytes), dtype=np.uint8)
+        else:
+            print(f"History mode {mode} not recognised! Exiting...")
+            exit(1)
+            
+    #* >>> Recording <<<
+    def _pack(self, state: list[bool]) -> np.ndarray:
+        return np.packbits(np.asarray(state, dtype=bool))
+    
+    def _unpack(self, packed: np.ndarray) -> np.ndarray:
+        return np.unpackbits(packed, count=self.number_of_cells).astype(bool)
+    
+    def append(self, state: list[bool]) -> None:
+        """
+        INPUTS:
+            + state (list[bool]) -> The flattened grid state of the next generation
+        """
+        packed = self._pack(state)
+        generation = self.number_of_generations
+        
+        if self.mode == "delta":
+            if generation % self.keyframe_interval == 0:
+                self.frames.append(zlib.compress(packed.tobytes()))
+            else:
+                self.frames.append(zlib.compress((packed ^ self._previous_frame).tobytes()))
+            self._previous_frame = packed
+        elif self.mode == "disk":
+            self._file.write(packed.tobytes())
+        else:
+            self.frames[generation % self.capacity] = packed
+            
+        self.number_of_generations += 1
+        
+    def close(self) -> None:
+        """
+        Finishes writing the history file in disk mode.
+        """
+        if self.mode == "disk" and not self._file.closed:
+            self._file.close()
+            
+    #* >>> Reading <<<
+    @property
+    def first_generation(self) -> int:
+        """
+        The oldest generation still held. This is only above 0 in ring mode.
+        """
+        if self.mode == "ring":
+            return max(0, self.number_of_generations - self.capacity)
+        return 0
+    
+    def get_generation(self, generation: int) -> np.ndarray:
+        """
+        INPUTS:
+            + generation (int) -> The generation number, counted from the first recorded
+        RETURNS:
+            + The flattened grid state of that generation as a bool array
+        """
+        if generation < self.first_generation or generation >= self.number_of_generations:
+            raise IndexError(f"Generation {generation} is not held in the history")
+        if generation == self._cached_generation:
+            return self._cached_frame
+        
+        if self.mode == "delta":
+            keyframe = generation - generation % self.keyframe_interval
+            # Continue from the cached frame if it lies between the keyframe and the target
+            if self._cached_generation is not None and keyframe <= self._cached_generation < generation:
+                start = self._cached_generation + 1
+                packed = np.packbits(self._cached_frame)
+            else:
+                start = keyframe + 1
+                packed = np.frombuffer(zlib.decompress(self.frames[keyframe]), dtype=np.uint8)
+            for index in range(start, generation + 1):
+                packed = packed ^ np.frombuffer(zlib.decompress(self.frames[index]), dtype=np.uint8)
+        elif self.mode == "disk":
+            packed = self._read_disk_frame(generation)
+        else:
+            packed = self.frames[generation % self.capacity]
+            
+        self._cached_generation = generation
+        self._cached_frame = self._unpack(packed)
+        return self._cached_frame
+    
+    def _read_disk_frame(self, generation: int) -> np.ndarray:
+        """
+        Reads one frame through a memory map of the history file, remapping it
+        if frames have been written since it was last mapped.
+        """
+        if not self._file.closed:
+            self._file.flush()
+        if self._memory_map is None or self._memory_map.shape[0] < self.number_of_generations:
+            self._memory_map = np.memmap(self.path, dtype=np.uint8, mode="r",
+                                         shape=(self.number_of_generations, self.frame_bytes))
+        return self._memory_map[generation]
+    
+    def __len__(self) -> int:
+        """
+        The number of generations which can be read back.
+        """
+        return self.number_of_generations - self.first_generation
+    
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        Indexes the generations which can be read back, oldest first, like a list.
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("History index out of range")
+        return self.get_generation(self.first_generation + index)
@@ -0,0 +1,66 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the NumpyEngine class, which stores the game grid as a
+2-d array and advances it using whole-array operations rather than
+looping over individual Cell objects.
+"""
+import numpy as np
+
+def count_padded_neighbours(padded: np.ndarray) -> np.ndarray:
+    """
+    Returns the number of live neighbours of every cell inside a board surrounded by a
+    one-cell ring of ghost cells. The last two axes are rows and columns, so a stack of
+    boards is counted at once.
+    """
+    rows, columns = padded.shape[-2] - 2, padded.shape[-1] - 2
+    num_neighbours = np.zeros(padded.shape[:-2] + (rows, columns), dtype=np.uint8)
+    for dy in [0,1,2]:
+        for dx in [0,1,2]:
+            # Cell should not count itself
+            if dx == 1 and dy == 1:
+                continue
+            num_neighbours += padded[..., dy:dy+rows, dx:dx+columns]
+    return num_neighbours
+
+def apply_rules(board: np.ndarray, num_neighbours: np.ndarray) -> np.ndarray:
+    """
+    Returns the next state of the board from its neighbour counts, as 0/1 uint8 values.
+    """
+    birth = num_neighbours == 3
+    survive = (board == 1) & (num_neighbours == 2)
+    return (birth | survive).astype(np.uint8)
+
+class NumpyEngine:
+    def __init__(self, initial_state: list[bool], grid_dimensions: tuple[int]) -> None:
+        """
+        INPUTS:
+            + initial_state (list[bool]) -> The flattened initial state of the grid, in the
+                                            same row-by-row layout used by Game
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                                (number_of_columns, number_of_rows)
+        """
+        self.grid_dimensions = grid_dimensions
+        # Rows are the first array axis so that flattening gives the Game layout
+        self.board = np.array(initial_state, dtype=np.uint8).reshape(
+            (grid_dimensions[1], grid_dimensions[0]))
+        self.num_neighbours = np.zeros_like(self.board)
+        
+    def get_state(self) -> list[bool]:
+        """
+        This function returns the flattened alive(True)/dead(False) states of the grid.
+        """
+        return self.board.ravel().astype(bool).tolist()
+    
+    def count_neighbours(self) -> None:
+        """
+        This function counts the number of neighbours of every cell at once. The board is
+        surrounded by a ring of dead ghost cells so the edges are not periodic.
+        """
+        self.num_neighbours = count_padded_neighbours(np.pad(self.board, 1))
+                
+    def update_grid(self) -> None:
+        """
+        This function applies the birth/survival rules to every cell at once.
+        """
+        self.board = apply_rules(self.board, self.num_neighbours)
@@ -0,0 +1,152 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the ParallelEngine class, which splits the game grid into
+horizontal strips stepped by separate worker processes. The grid lives in a
+multiprocessing shared memory buffer, so it is never pickled between processes.
+"""
+import os
+import weakref
+import numpy as np
+from multiprocessing import Barrier, Process, shared_memory
+from NumpyEngine import count_padded_neighbours, apply_rules
+
+# Number of generations which tells the workers to exit
+STOP = -1
+# The shared memory starts with the command sent to the workers, the number of
+#  generations to run and the current board, as two int64 values
+COMMAND_BYTES = 16
+
+def _step_strip(source: np.ndarray, target: np.ndarray, first_row: int, last_row: int) -> None:
+    """
+    Steps the grid rows [first_row, last_row) from source into target. Both boards have a
+    one-cell ring of dead ghost cells, and the ghost rows and the neighbouring strips' edge
+    rows act as the halo of this strip.
+    """
+    halo = source[first_row:last_row + 2]
+    target[first_row+1:last_row+1, 1:-1] = apply_rules(halo[1:-1, 1:-1], count_padded_neighbours(halo))
+
+def _worker(memory_name: str, board_shape: tuple[int], first_row: int, last_row: int,
+            control_barrier: Barrier, step_barrier: Barrier) -> None:
+    """
+    Worker process loop. Waits for a command, runs that many generations on its strip
+    with a barrier after each one, then reports back through the control barrier.
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    boards = np.ndarray((2, *board_shape), dtype=np.uint8, buffer=memory.buf[COMMAND_BYTES:])
+    command = np.ndarray((2,), dtype=np.int64, buffer=memory.buf[:COMMAND_BYTES])
+    try:
+        while True:
+            control_barrier.wait()
+            number_of_steps, current = int(command[0]), int(command[1])
+            if number_of_steps == STOP:
+                break
+            for _ in range(number_of_steps):
+                _step_strip(boards[current], boards[1 - current], first_row, last_row)
+                # Every strip must finish before any halo rows are read again
+                step_barrier.wait()
+                current = 1 - current
+            control_barrier.wait()
+    finally:
+        del boards, command
+        memory.close()
+
+def _shutdown(memory: shared_memory.SharedMemory, control_barrier: Barrier,
+              workers: list[Process]) -> None:
+    """
+    Tells the workers to exit, waits for them and frees the shared memory.
+    """
+    command = np.ndarray((2,), dtype=np.int64, buffer=memory.buf[:COMMAND_BYTES])
+    command[0] = STOP
+    del command
+    control_barrier.wait()
+    for worker in workers:
+        worker.join()
+    memory.close()
+    memory.unlink()
+
+class ParallelEngine:
+    def __init__(self, initial_state: list[bool], grid_dimensions: tuple[int],
+                 number_of_workers: int | None = None) -> None:
+        """
+        INPUTS:
+            + initial_state (list[bool]) -> The flattened initial state of the grid, in the
+                                            same row-by-row layout used by Game
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                                (number_of_columns, number_of_rows)
+            + number_of_workers (int) -> The number of worker processes, defaults to the
+                                            number of cores. Each gets a strip of rows.
+        """
+        self.grid_dimensions = grid_dimensions
+        columns, rows = grid_dimensions
+        if number_of_workers is None:
+            number_of_workers = os.cpu_count() or 1
+        self.number_of_workers = max(1, min(number_of_workers, rows))
+        
+        # Two boards with ghost cells, the current one is swapped after every generation.
+        #  The first COMMAND_BYTES bytes hold the command sent to the workers.
+        self.board_shape = (rows + 2, columns + 2)
+        self.memory = shared_memory.SharedMemory(create=True, size=COMMAND_BYTES + 2 * (rows + 2) * (columns + 2))
+        boards = self._boards()
+        boards[:] = 0
+        boards[0, 1:rows+1, 1:columns+1] = np.asarray(initial_state, dtype=np.uint8).reshape((rows, columns))
+        del boards
+        self.current = 0
+        
+        # Split the rows as evenly as possible between the workers
+        self.control_barrier = Barrier(self.number_of_workers + 1)
+        self.step_barrier = Barrier(self.number_of_workers)
+        boundaries = np.linspace(0, rows, self.number_of_workers + 1).astype(int)
+        self.workers = []
+        for worker_index in range(self.number_of_workers):
+            worker = Process(target=_worker, daemon=True,
+                             args=(self.memory.name, self.board_shape, boundaries[worker_index],
+                                   boundaries[worker_index + 1], self.control_barrier, self.step_barrier))
+            worker.start()
+            self.workers.append(worker)
+        # Runs on close, garbage collection or interpreter exit, whichever comes first
+        self._finalizer = weakref.finalize(self, _shutdown, self.memory, self.control_barrier, self.workers)
+        
+    def _boards(self) -> np.ndarray:
+        """
+        Returns a view of both boards in the shared memory. Views are not kept on the
+        object so the shared memory can always be closed.
+        """
+        return np.ndarray((2, *self.board_shape), dtype=np.uint8, buffer=self.memory.buf[COMMAND_BYTES:])
+            
+    def get_state(self) -> list[bool]:
+        """
+        This function returns the flattened alive(True)/dead(False) states of the grid.
+        """
+        columns, rows = self.grid_dimensions
+        return self._boards()[self.current, 1:rows+1, 1:columns+1].ravel().astype(bool).tolist()
+    
+    def advance(self, number_of_steps: int) -> None:
+        """
+        INPUTS:
+            + number_of_steps (int) -> How many generations the workers should run
+                                        before handing the grid back
+        """
+        if number_of_steps <= 0:
+            return
+        command = np.ndarray((2,), dtype=np.int64, buffer=self.memory.buf[:COMMAND_BYTES])
+        command[0] = number_of_steps
+        command[1] = self.current
+        del command
+        self.control_barrier.wait() # Start the workers
+        self.control_barrier.wait() # Wait for them to finish
+        self.current = (self.current + number_of_steps) % 2
+        
+    def count_neighbours(self) -> None:
+        """
+        Neighbours are counted by the workers while advancing, so there is nothing to do here.
+        """
+        
+    def update_grid(self) -> None:
+        self.advance(1)
+        
+    def close(self) -> None:
+        """
+        Stops the worker processes and frees the shared memory.
+        """
+        self._finalizer()
@@ -0,0 +1,168 @@
+"""
+Date of creation: 17/10/26
+
+This file holds functions which load standard Game of Life pattern files,
+in either run length encoded (.rle) or plaintext (.cells) format. Files are
+read line by line and cells are written straight into a 2-d array. Parsed
+patterns can be cached on disk, bit-packed, under the hash of the file so that
+loading the same file again is instant. Caching is off unless a cache directory
+is given.
+"""
+import hashlib
+import os
+import re
+from typing import TextIO
+import numpy as np
+
+RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)")
+RLE_ITEM = re.compile(r"(\d*)([^\d\s])")
+
+def parse_rle(pattern_file: TextIO) -> np.ndarray:
+    """
+    INPUTS:
+        + pattern_file (TextIO) -> An open run length encoded pattern file
+    RETURNS:
+        + A (number_of_rows, number_of_columns) bool array of the pattern
+    RAISES:
+        + ValueError -> If live cells are placed outside the size given in the header
+    """
+    pattern = None
+    row, column = 0, 0
+    pending_count = "" # Run count which may continue onto the next line
+    
+    for line in pattern_file:
+        line = line.strip()
+        if pattern is None:
+            # Comment lines come before the header which gives the pattern size
+            if line == "" or line.startswith("#"):
+                continue
+            header = RLE_HEADER.match(line)
+            if header is None:
+                print("RLE pattern has no valid header line! Exiting...")
+                exit(1)
+            pattern = np.zeros((int(header.group(2)), int(header.group(1))), dtype=bool)
+            continue
+        
+        # Digits at the end of a line belong to the first item on the next line
+        trailing_digits = re.search(r"\d*$", line).group()
+        items = RLE_ITEM.findall(line[:len(line) - len(trailing_digits)])
+        for count, tag in items:
+            run_length = int(pending_count + count) if pending_count + count else 1
+            pending_count = ""
+            if tag == "!":
+                return pattern
+            elif tag == "$":
+                row += run_length
+                column = 0
+            elif tag == "b":
+                column += run_length
+            else:
+                # o marks live cells, any other letter is a live cell of a multi-state rule
+                if row >= pattern.shape[0] or column + run_length > pattern.shape[1]:
+                    raise ValueError(f"RLE pattern places live cells at row {row}, columns {column} to "
+                                     f"{column + run_length - 1}, outside its header size of "
+                                     f"x = {pattern.shape[1]}, y = {pattern.shape[0]}")
+                pattern[row, column:column + run_length] = True
+                column += run_length
+        pending_count += trailing_digits
+        
+    if pattern is None:
+        print("RLE pattern has no valid header line! Exiting...")
+        exit(1)
+    return pattern
+
+def parse_plaintext(pattern_file: TextIO) -> np.ndarray:
+    """
+    INPUTS:
+        + pattern_file (TextIO) -> An open plaintext pattern file, which must be seekable
+    RETURNS:
+        + A (number_of_rows, number_of_columns) bool array of the pattern
+    """
+    # First pass finds the size of the pattern, so no rows need to be held in memory
+    number_of_rows, number_of_columns = 0, 0
+    for line in pattern_file:
+        if line.startswith("!"):
+            continue
+        number_of_rows += 1
+        number_of_columns = max(number_of_columns, len(line.rstrip()))
+        
+    pattern = np.zeros((number_of_rows, number_of_columns), dtype=bool)
+    pattern_file.seek(0)
+    row = 0
+    for line in pattern_file:
+        if line.startswith("!"):
+            continue
+        line = line.rstrip().encode()
+        # Any character other than . is a live cell
+        pattern[row, :len(line)] = np.frombuffer(line, dtype=np.uint8) != ord(".")
+        row += 1
+    return pattern
+
+def _file_hash(path: str) -> str:
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as pattern_file:
+        for chunk in iter(lambda: pattern_file.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+def load_pattern(path: str, cache_directory: str | None = None) -> np.ndarray:
+    """
+    INPUTS:
+        + path (str) -> Path to a .rle or .cells pattern file
+        + cache_directory (str) -> Where parsed patterns are cached, for example
+                                    ~/.cache/conway_game_of_life. None turns off caching.
+    RETURNS:
+        + A (number_of_rows, number_of_columns) bool array of the pattern
+    """
+    cache_path = None
+    if cache_directory is not None:
+        cache_path = os.path.join(cache_directory, _file_hash(path) + ".npz")
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                number_of_rows, number_of_columns = cached["shape"]
+                cells = np.unpackbits(cached["packed"], count=number_of_rows * number_of_columns)
+            return cells.astype(bool).reshape((number_of_rows, number_of_columns))
+    
+    with open(path, "r") as pattern_file:
+        if path.endswith(".rle"):
+            pattern = parse_rle(pattern_file)
+        elif path.endswith(".cells"):
+            pattern = parse_plaintext(pattern_file)
+        else:
+            print(f"Pattern file {path} is not a .rle or .cells file! Exiting...")
+            exit(1)
+            
+    if cache_path is not None:
+        os.makedirs(cache_directory, exist_ok=True)
+        # Write to a temporary file first so a partly written cache is never read
+        temporary_path = cache_path + ".tmp.npz"
+        np.savez(temporary_path, packed=np.packbits(pattern), shape=np.array(pattern.shape))
+        os.replace(temporary_path, cache_path)
+    return pattern
+
+def place_pattern(pattern: np.ndarray, offset: tuple[int] = (0,0), padding: int = 0,
+                  grid_dimensions: tuple[int] | None = None) -> tuple[np.ndarray, tuple[int]]:
+    """
+    INPUTS:
+        + pattern (np.ndarray) -> A (number_of_rows, number_of_columns) bool array
+        + offset (tuple(int)) -> The (x,y) position of the pattern's top left corner,
+                                    measured from inside the padding
+        + padding (int) -> Number of dead cells to leave around every side of the pattern
+        + grid_dimensions (tuple(int)) -> The grid dimensions as (number_of_columns, number_of_rows).
+                                            If None the grid is made just large enough.
+    RETURNS:
+        + The flattened grid state in the Game layout
+        + The grid dimensions
+    """
+    pattern_rows, pattern_columns = pattern.shape
+    x_start = padding + offset[0]
+    y_start = padding + offset[1]
+    if grid_dimensions is None:
+        grid_dimensions = (x_start + pattern_columns + padding, y_start + pattern_rows + padding)
+    if x_start + pattern_columns > grid_dimensions[0] or y_start + pattern_rows > grid_dimensions[1]:
+        print("Pattern does not fit inside the grid at the given offset! Exiting...")
+        exit(1)
+        
+    grid = np.zeros((grid_dimensions[1], grid_dimensions[0]), dtype=bool)
+    grid[y_start:y_start + pattern_rows, x_start:x_start + pattern_columns] = pattern
+    return grid.ravel(), grid_dimensions
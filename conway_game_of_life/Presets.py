@@ -3,17 +3,32 @@ Author: Ewan Jones
 Date of creation: 31/1/24
 
 This file contains a class which defines
-the preset game states.
+the preset game states. Patterns can also be
+loaded from .rle or .cells files.
 """
+from PatternLoader import load_pattern, place_pattern
 
 class Presets:
     
-    def __init__(self, preset_name: str) -> None:
+    def __init__(self, preset_name: str, offset: tuple[int] = (0,0), padding: int = 0,
+                 grid_dimensions: tuple[int] | None = None, cache_directory: str | None = None) -> None:
+        """
+        INPUTS:
+            + preset_name (str) -> The name of a preset, or the path to a pattern file
+            + offset (tuple(int)) -> The (x,y) position of a loaded pattern within the grid
+            + padding (int) -> Number of dead cells to leave around a loaded pattern
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid a loaded pattern is
+                                                placed in. If None it is made just large enough.
+            + cache_directory (str) -> Where parsed pattern files are cached, None turns off caching
+        """
         self.initial_state = None
         self.grid_dimensions = None
         
         if preset_name == "pulsar_single":
             self.pulsar_single()
+        elif preset_name.endswith((".rle", ".cells")):
+            self.initial_state, self.grid_dimensions = place_pattern(load_pattern(preset_name, cache_directory),
+                                                                     offset, padding, grid_dimensions)
         else:
             print("Preset name not recognised! Exiting...")
             exit(1)
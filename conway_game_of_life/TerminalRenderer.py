@@ -0,0 +1,85 @@
+"""
+Date of creation: 17/10/26
+
+This file holds the TerminalRenderer class, which draws the game grid in the
+terminal. After the first frame only the cells which changed are redrawn,
+using ANSI cursor movement, and frames are paced to a target frame rate.
+"""
+import sys
+from time import perf_counter, sleep
+from typing import TextIO
+import numpy as np
+
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+ALIVE_CHARACTER = "x"
+DEAD_CHARACTER = "-"
+
+class TerminalRenderer:
+    def __init__(self, grid_dimensions: tuple[int], frames_per_second: float = 5,
+                 output: TextIO = sys.stdout) -> None:
+        """
+        INPUTS:
+            + grid_dimensions (tuple(int)) -> The dimensions of the grid as
+                                                (number_of_columns, number_of_rows)
+            + frames_per_second (float) -> The target rate at which frames are drawn
+            + output (TextIO) -> Where the frames are written to
+        """
+        self.grid_dimensions = grid_dimensions
+        self.frame_time = 1 / frames_per_second
+        self.output = output
+        
+        self.previous_frame = None # The frame currently on screen
+        self.last_draw_time = None
+        
+    @staticmethod
+    def _move_cursor(row: int, column: int) -> str:
+        # ANSI rows and columns count from 1
+        return f"\x1b[{row + 1};{column + 1}H"
+    
+    def _full_frame(self, frame: np.ndarray) -> str:
+        rows = ["".join(ALIVE_CHARACTER if cell else DEAD_CHARACTER for cell in row) for row in frame]
+        return CLEAR_SCREEN + "\n".join(rows)
+    
+    def _diff_frame(self, frame: np.ndarray) -> str:
+        """
+        Returns the cursor moves and characters which redraw only the changed cells.
+        Neighbouring changed cells in a row are written after a single cursor move.
+        """
+        pieces = []
+        changed_rows, changed_columns = np.nonzero(frame != self.previous_frame)
+        run_start = None
+        for index, (row, column) in enumerate(zip(changed_rows.tolist(), changed_columns.tolist())):
+            if run_start is None:
+                run_start = (row, column)
+                pieces.append(self._move_cursor(row, column))
+            pieces.append(ALIVE_CHARACTER if frame[row, column] else DEAD_CHARACTER)
+            # The run ends if the next changed cell is not directly to the right
+            next_index = index + 1
+            if next_index == len(changed_rows) or changed_rows[next_index] != row \
+                    or changed_columns[next_index] != column + 1:
+                run_start = None
+        return "".join(pieces)
+    
+    def draw(self, grid_state: list[bool]) -> None:
+        """
+        INPUTS:
+            + grid_state (list[bool]) -> The flattened grid state to draw
+        """
+        # Wait out whatever is left of the frame time after simulating this step
+        if self.last_draw_time is not None:
+            remaining_time = self.frame_time - (perf_counter() - self.last_draw_time)
+            if remaining_time > 0:
+                sleep(remaining_time)
+        
+        frame = np.asarray(grid_state, dtype=bool).reshape((self.grid_dimensions[1], self.grid_dimensions[0]))
+        if self.previous_frame is None:
+            text = self._full_frame(frame)
+        else:
+            text = self._diff_frame(frame)
+        # Leave the cursor below the grid, and write the whole frame at once
+        text += self._move_cursor(self.grid_dimensions[1], 0)
+        self.output.write(text)
+        self.output.flush()
+        
+        self.previous_frame = frame
+        self.last_draw_time = perf_counter()
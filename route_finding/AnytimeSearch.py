@@ -0,0 +1,153 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for anytime repairing A* (ARA*). A first route is
+found quickly by inflating the heuristic, then the route is improved by searching again with
+smaller weights until the route is optimal or the time or expansion budget runs out. Each pass
+carries on from the costs found by the last, so the extra passes are cheap.
+"""
+import heapq
+import time
+from itertools import count
+from Heuristics import octile_distance, step_cost, move_cost
+
+class AnytimeSearch:
+    """
+    Class which runs anytime repairing A* search over the walls of a Grid.
+    """
+    
+    #* >>> Constructor is called when search object is instantiated <<<
+    def __init__(self, grid, initial_weight: float = 3.0, weight_step: float = 0.5) -> None:
+        """
+        Inputs:
+            + grid -> The Grid to search, only its walls and dimensions are used
+            + initial_weight -> The heuristic weight of the first pass, larger finds a first route sooner
+            + weight_step -> How much the weight is lowered after each pass, down to 1
+        """
+        self.grid = grid
+        self.initial_weight = initial_weight
+        self.weight_step = weight_step
+        self.nodes_expanded = 0 # Number of nodes expanded over all passes of the last search
+        self.weight = None # Heuristic weight of the latest pass, which may have been cut short by the budget
+        # The returned route costs at most this many times the optimal route cost. This is
+        #  None if no route was found.
+        self.suboptimality_bound = None
+        
+    # Helper function giving the priority of a node for the current weight
+    def _priority(self, position: tuple[int]) -> float:
+        return self.g_values[position] + self.weight * octile_distance(position, self.end_position)
+    
+    #* >>> Adds a node to the priority queue with its current cost values <<<
+    def _push_open(self, position: tuple[int]) -> None:
+        self.open_list.add(position)
+        heapq.heappush(self.open_heap, (self._priority(position), next(self._heap_counter), self.g_values[position], position))
+        
+    #* >>> Expands nodes until the route to the end is within the current weight of optimal <<<
+    def _improve_route(self, deadline: float | None, max_iter: int) -> bool:
+        """
+        Inputs:
+            + deadline -> The time.perf_counter() value at which to stop, None for no limit
+            + max_iter -> The number of expansions over all passes at which to stop
+        Returns:
+            + False if the budget ran out before the pass finished
+        """
+        while True:
+            # Drop entries for nodes already expanded or whose cost has since dropped
+            while self.open_heap and (self.open_heap[0][3] not in self.open_list or
+                                      self.open_heap[0][2] != self.g_values[self.open_heap[0][3]]):
+                heapq.heappop(self.open_heap)
+            if not self.open_heap:
+                return True
+            if self.end_position in self.g_values and self._priority(self.end_position) <= self.open_heap[0][0]:
+                return True
+            if self.nodes_expanded >= max_iter or (deadline is not None and time.perf_counter() >= deadline):
+                return False
+            
+            _, _, _, current = heapq.heappop(self.open_heap)
+            self.open_list.remove(current)
+            self.closed_list.add(current)
+            self.nodes_expanded += 1
+            
+            for dx in [-1,0,1]:
+                for dy in [-1,0,1]:
+                    if dx == 0 and dy == 0:
+                        continue
+                    neighbour = (current[0] + dx, current[1] + dy)
+                    if not self.grid._is_traversable(neighbour):
+                        continue
+                    g_value = self.g_values[current] + move_cost(dx, dy)
+                    if g_value >= self.g_values.get(neighbour, g_value + 1):
+                        continue
+                    self.g_values[neighbour] = g_value
+                    self.parents[neighbour] = current
+                    if neighbour in self.closed_list:
+                        # Nodes are expanded once per pass, so this one waits for the next pass
+                        self.inconsistent_list.add(neighbour)
+                    else:
+                        self._push_open(neighbour)
+                        
+    #* >>> Returns the route to the end found so far by tracing back through parent nodes <<<
+    def _trace_route(self) -> list[tuple]:
+        route = []
+        position = self.end_position
+        while position is not None:
+            route.insert(0, position)
+            position = self.parents[position]
+        return route
+    
+    #* >>> Method which finds a route, improving it until the budget runs out <<<
+    def find_route(self, start_position: tuple[int], end_position: tuple[int],
+                   max_iter: int = 10000, time_limit: float | None = None) -> list[tuple]:
+        """
+        Inputs:
+            + start_position -> The grid coordinate of the route's starting point
+            + end_position -> The grid coordinate of the route's ending point
+            + max_iter -> The maximum number of nodes that will be expanded over all passes
+            + time_limit -> The most seconds to spend searching, None for no limit
+        Returns:
+            + Coordinates of nodes in the best route found, ordered from start node to end node.
+              This is empty if no route was found within the budget.
+        """
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.end_position = end_position
+        self.nodes_expanded = 0
+        self.weight = self.initial_weight
+        self.suboptimality_bound = None
+        
+        self.g_values = {start_position: 0}
+        self.parents = {start_position: None}
+        self.open_list = set()
+        self.closed_list = set()
+        self.inconsistent_list = set() # Closed nodes whose cost dropped during the current pass
+        self.open_heap = []
+        self._heap_counter = count()
+        self._push_open(start_position)
+        
+        route = []
+        while self._improve_route(deadline, max_iter):
+            if end_position not in self.g_values:
+                print("There exists no valid route to destination!")
+                return []
+            route = self._trace_route()
+            route_cost = sum(step_cost(a, b) for a, b in zip(route, route[1:]))
+            
+            # Every route not yet found passes through an open or inconsistent node, so the
+            #  lowest unweighted f-value among them bounds the optimal route cost from below
+            remaining = self.open_list | self.inconsistent_list
+            lower_bound = min([self.g_values[position] + octile_distance(position, end_position)
+                               for position in remaining], default=route_cost)
+            self.suboptimality_bound = self.weight if lower_bound <= 0 else min(self.weight, route_cost / lower_bound)
+            if self.suboptimality_bound <= 1:
+                self.suboptimality_bound = 1.0
+                break
+            
+            # Lower the weight and search again, starting from every node left to improve
+            self.weight = max(1.0, self.weight - self.weight_step)
+            for position in self.inconsistent_list:
+                self.open_list.add(position)
+            self.inconsistent_list = set()
+            self.closed_list = set()
+            self.open_heap = []
+            for position in self.open_list:
+                heapq.heappush(self.open_heap, (self._priority(position), next(self._heap_counter), self.g_values[position], position))
+        return route
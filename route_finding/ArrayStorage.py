@@ -0,0 +1,125 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for array storage. This holds the values of
+every node in the grid in flat numpy arrays rather than as Node objects, which keeps
+memory use low on very large grids. Nodes are read and written through NodeView objects.
+"""
+import numpy as np
+from Node import Node, NodeView
+
+# Largest f-value held, one below the int32 limit since values are stored plus one
+MAX_F_VALUE = 2**31 - 2
+
+class ArrayStorage:
+    """
+    Class which stores the grid's nodes in flat arrays indexed by grid index.
+    """
+    
+    #* >>> Constructor is called when storage object is instantiated <<<
+    def __init__(self, dimensions: tuple[int], wall_bits: np.ndarray | None = None) -> None:
+        """
+        Inputs:
+            + dimensions -> The dimensions of the grid in number of nodes (x_dimension, y_dimension)
+            + wall_bits -> An existing wall bitmap to use, for example one held in shared memory
+        """
+        self.dimensions = dimensions
+        self.number_of_nodes = dimensions[0] * dimensions[1]
+        
+        # One bit per node, set if the node is a wall
+        if wall_bits is None:
+            wall_bits = np.zeros((self.number_of_nodes + 7) // 8, dtype=np.uint8)
+        self.wall_bits = wall_bits
+        
+        # g, f and parent values are stored plus one so that zero means unset. Zeroed arrays
+        #  are not given memory by the operating system until written to, so only the part
+        #  of the grid explored by a search takes up memory. The h-value is f - g, so it is
+        #  not stored.
+        self.g_values = np.zeros(self.number_of_nodes, dtype=np.int32)
+        self.f_values = np.zeros(self.number_of_nodes, dtype=np.int32)
+        self.parents = np.zeros(self.number_of_nodes, dtype=np.int32)
+        
+        # One bit per node, set if the node was reached by search_id. The bits are cleared
+        #  when a node is stamped with a new search, which takes one byte per eight nodes
+        #  rather than a stamp on every node.
+        self.search_id = None
+        self.reached_bits = np.zeros((self.number_of_nodes + 7) // 8, dtype=np.uint8)
+        
+    #* >>> The storage can be used in place of the list of nodes <<<
+    def __len__(self) -> int:
+        return self.number_of_nodes
+    
+    def __getitem__(self, index: int) -> NodeView:
+        return NodeView(self, index)
+    
+    def __setitem__(self, index: int, node: Node) -> None:
+        # Copy the node's values into the arrays
+        self.set_wall(index, not node.traversable)
+        self.set_g_value(index, node.g_value)
+        self.set_f_value(index, node.f_value)
+        self.set_parent(index, None if node.parent is None else
+                        node.parent.position[0] + node.parent.position[1] * self.dimensions[0])
+        self.set_search_id(index, node.search_id)
+        
+    #* >>> Accessors used by NodeView <<<
+    def is_wall(self, index: int) -> bool:
+        return bool(self.wall_bits[index >> 3] & (128 >> (index & 7)))
+    
+    def set_wall(self, index: int, is_wall: bool) -> None:
+        if is_wall:
+            self.wall_bits[index >> 3] |= 128 >> (index & 7)
+        else:
+            self.wall_bits[index >> 3] &= 255 ^ (128 >> (index & 7))
+            
+    def wall_mask(self) -> np.ndarray:
+        """
+        Returns:
+            + A flat bool array which is True at the grid index of every wall
+        """
+        return np.unpackbits(self.wall_bits, count=self.number_of_nodes).astype(bool)
+    
+    def get_g_value(self, index: int) -> int | None:
+        stored = int(self.g_values[index])
+        return None if stored == 0 else stored - 1
+    
+    def set_g_value(self, index: int, g_value: int | None) -> None:
+        self.g_values[index] = 0 if g_value is None else g_value + 1
+        
+    def get_f_value(self, index: int) -> int | None:
+        stored = int(self.f_values[index])
+        return None if stored == 0 else stored - 1
+    
+    def set_f_value(self, index: int, f_value: int | None) -> None:
+        # The default squared distance heuristic passes the int32 limit on grids wider
+        #  than about 46,000 nodes, so larger f-values are clamped. Only the order of
+        #  nodes far from the end is affected.
+        self.f_values[index] = 0 if f_value is None else min(f_value, MAX_F_VALUE) + 1
+        
+    def get_parent(self, index: int) -> int | None:
+        stored = int(self.parents[index])
+        return None if stored == 0 else stored - 1
+    
+    def set_parent(self, index: int, parent_index: int | None) -> None:
+        self.parents[index] = 0 if parent_index is None else parent_index + 1
+        
+    def get_search_id(self, index: int) -> int | None:
+        if self.reached_bits[index >> 3] & (128 >> (index & 7)):
+            return self.search_id
+        return None
+    
+    def set_search_id(self, index: int, search_id: int | None) -> None:
+        if search_id is None:
+            self.reached_bits[index >> 3] &= 255 ^ (128 >> (index & 7))
+            return
+        self.start_search(search_id)
+        self.reached_bits[index >> 3] |= 128 >> (index & 7)
+        
+    def start_search(self, search_id: int) -> None:
+        """
+        Inputs:
+            + search_id -> The search that nodes are stamped with from now on. Every node
+                           stamped with an earlier search is left unreached.
+        """
+        if search_id != self.search_id:
+            self.reached_bits[:] = 0
+            self.search_id = search_id
@@ -0,0 +1,126 @@
+"""
+Creation Date: 17/10/2026
+
+This file runs MovingAI benchmark scenarios through Grid.find_route and writes the
+results as JSON, so that changes to the searches can be compared. Run it from this
+directory, for example
+
+    python Benchmark.py --map arena.map --scen arena.map.scen --modes astar jps --buckets 0 5 10
+
+Each result holds the queries answered per second, the latency percentiles, the peak
+memory traced while running, and the search statistics from Grid's instrumentation.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import tracemalloc
+from time import perf_counter
+import numpy as np
+from Grid import Grid
+from MovingAI import load_map, load_scenarios
+
+MODES = ["astar", "jps", "bidirectional", "hierarchical", "incremental", "flow", "anytime"]
+
+#* >>> Builds a grid and runs every scenario on it, timing each query <<<
+def _run_queries(dimensions: tuple[int], wall_positions: list[tuple[int]], scenarios: list, mode: str,
+                 heuristic: str, storage: str, max_iter: int, time_limit: float | None) -> tuple:
+    setup_start = perf_counter()
+    grid = Grid(dimensions, wall_positions, storage=storage, heuristic=heuristic, instrument=True)
+    setup_time = perf_counter() - setup_start
+    
+    latencies = []
+    statistics = {"nodes_expanded": [], "open_list_peak": [], "decrease_keys": []}
+    phase_times = {}
+    routes_found = 0
+    for scenario in scenarios:
+        query_start = perf_counter()
+        # The searches report routes that cannot be found, which would swamp the results
+        with contextlib.redirect_stdout(io.StringIO()):
+            route = grid.find_route(scenario.start_position, scenario.end_position, max_iter,
+                                    mode=mode, time_limit=time_limit)
+        latencies.append(perf_counter() - query_start)
+        routes_found += len(route) > 0
+        for name, values in statistics.items():
+            if grid.search_stats[name] is not None:
+                values.append(grid.search_stats[name])
+        for phase, phase_time in grid.search_stats["phase_seconds"].items():
+            phase_times[phase] = phase_times.get(phase, 0.0) + phase_time
+    return setup_time, latencies, statistics, phase_times, routes_found
+
+def run_bucket(dimensions: tuple[int], wall_positions: list[tuple[int]], scenarios: list, mode: str,
+               heuristic: str = "euclidean", storage: str = "nodes", max_iter: int = 10**7,
+               time_limit: float | None = None) -> dict:
+    """
+    Inputs:
+        + dimensions -> The dimensions of the map (x_dimension, y_dimension)
+        + wall_positions -> The (x,y) coordinates of the map's walls
+        + scenarios -> The scenarios to run, all from the same bucket
+        + mode -> The search mode passed to Grid.find_route
+        + heuristic -> The heuristic passed to Grid
+        + storage -> The node storage passed to Grid
+        + max_iter -> The maximum number of iterations for each route
+        + time_limit -> The most seconds each anytime search will run for
+    Returns:
+        + The benchmark result
+    """
+    # Tracing every allocation slows the searches several times over, so queries are
+    #  timed in one pass and the peak memory is measured in a second pass
+    setup_time, latencies, statistics, phase_times, routes_found = _run_queries(
+        dimensions, wall_positions, scenarios, mode, heuristic, storage, max_iter, time_limit)
+    tracemalloc.start()
+    _run_queries(dimensions, wall_positions, scenarios, mode, heuristic, storage, max_iter, time_limit)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    total_time = sum(latencies)
+    return {"bucket": scenarios[0].bucket, "mode": mode, "heuristic": heuristic, "storage": storage,
+            "queries": len(scenarios), "routes_found": routes_found,
+            "queries_per_second": len(scenarios) / total_time if total_time > 0 else None,
+            "latency_seconds": {f"p{percentile}": float(np.percentile(latencies, percentile))
+                                for percentile in [50, 90, 99]} | {"max": max(latencies)},
+            "setup_seconds": setup_time, "peak_memory_bytes": peak_memory,
+            "mean_search_stats": {name: float(np.mean(values)) if values else None for name, values in statistics.items()},
+            "phase_seconds": phase_times}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Grid.find_route on MovingAI scenarios.")
+    parser.add_argument("--map", required=True, help="The MovingAI .map file")
+    parser.add_argument("--scen", required=True, help="The MovingAI .scen file for the map")
+    parser.add_argument("--modes", nargs="+", default=["astar", "jps"], choices=MODES)
+    parser.add_argument("--heuristic", default="euclidean", choices=["euclidean", "octile", "alt"])
+    parser.add_argument("--storage", default="nodes", choices=["nodes", "arrays"])
+    parser.add_argument("--buckets", nargs="+", type=int, default=None, help="Buckets to run, defaults to all")
+    parser.add_argument("--queries-per-bucket", type=int, default=None)
+    parser.add_argument("--max-iter", type=int, default=10**7)
+    parser.add_argument("--time-limit", type=float, default=None, help="Seconds per anytime search")
+    parser.add_argument("--output", default="route_benchmark_results.json")
+    arguments = parser.parse_args()
+    
+    dimensions, wall_positions = load_map(arguments.map)
+    buckets = {}
+    for scenario in load_scenarios(arguments.scen):
+        if arguments.buckets is None or scenario.bucket in arguments.buckets:
+            buckets.setdefault(scenario.bucket, []).append(scenario)
+            
+    results = []
+    for bucket in sorted(buckets):
+        scenarios = buckets[bucket][:arguments.queries_per_bucket]
+        for mode in arguments.modes:
+            result = run_bucket(dimensions, wall_positions, scenarios, mode, arguments.heuristic,
+                                arguments.storage, arguments.max_iter, arguments.time_limit)
+            results.append(result)
+            print(f"{bucket:>6} {mode:>13} {result['queries']:>6} "
+                  f"{result['queries_per_second'] or 0:>10.1f} queries/s "
+                  f"p50 {result['latency_seconds']['p50'] * 1e3:>8.2f} ms "
+                  f"p99 {result['latency_seconds']['p99'] * 1e3:>8.2f} ms "
+                  f"{result['peak_memory_bytes'] / 2**20:>9.1f} MiB")
+            
+    with open(arguments.output, "w") as output_file:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                   "map": arguments.map, "scenarios": arguments.scen, "results": results}, output_file, indent=2)
+    print(f"Results written to {arguments.output}")
+    
+if __name__ == "__main__":
+    main()
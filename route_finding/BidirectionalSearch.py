@@ -0,0 +1,138 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for bidirectional A* search. One search runs
+forwards from the start and another backwards from the end, each with its own costs and
+parent chain, and the route is joined where the two meet. On maze-like grids the two
+smaller search fronts expand far fewer nodes than a single front grown all the way.
+"""
+import heapq
+from itertools import count
+from Heuristics import octile_distance, move_cost, ORTHOGONAL_COST
+
+class BidirectionalSearch:
+    """
+    Class which runs bidirectional A* search over the walls of a Grid.
+    """
+    
+    #* >>> Constructor is called when search object is instantiated <<<
+    def __init__(self, grid) -> None:
+        """
+        Inputs:
+            + grid -> The Grid to search, only its walls and dimensions are used
+        """
+        self.grid = grid
+        self.nodes_expanded = 0 # Number of nodes expanded by both directions in the last search
+        
+    #* >>> Method which finds the shortest route between start and end positions <<<
+    def find_route(self, start_position: tuple[int], end_position: tuple[int],
+                   max_iter: int = 10000) -> list[tuple]:
+        """
+        Inputs:
+            + start_position -> The grid coordinate of the route's starting point
+            + end_position -> The grid coordinate of the route's ending point
+            + max_iter -> The maximum number of nodes that will be expanded, over both directions
+        Returns:
+            + Coordinates of nodes in the optimal route, ordered from start node to end node.
+              This is empty if no route was found, or if max_iter ran out before the best
+              route so far was known to be optimal.
+        """
+        self.nodes_expanded = 0
+        if start_position == end_position:
+            return [start_position]
+        
+        # Each direction has its own costs, parents, closed list and open heaps, and aims
+        #  for the other end of the route. Open nodes are held both in a heap ordered by
+        #  (f, h, insertion counter, position) and in one ordered by (g, insertion counter,
+        #  position), and entries for closed nodes or outdated g-values are skipped.
+        targets = [end_position, start_position]
+        g_values = [{start_position: 0}, {end_position: 0}]
+        parents = [{start_position: None}, {end_position: None}]
+        closed_lists = [set(), set()]
+        insertion_counter = count()
+        open_heaps = [[(octile_distance(start_position, end_position), octile_distance(start_position, end_position),
+                        next(insertion_counter), start_position)],
+                      [(octile_distance(end_position, start_position), octile_distance(end_position, start_position),
+                        next(insertion_counter), end_position)]]
+        g_heaps = [[(0, next(insertion_counter), start_position)], [(0, next(insertion_counter), end_position)]]
+        
+        best_cost = None # Cost of the best route found so far through a meeting node
+        meeting_node = None
+        # True once the search has stopped on its own, rather than running out of max_iter
+        #  while the best route so far could still be improved
+        finished = False
+        
+        while self.nodes_expanded < max_iter:
+            # Drop outdated entries so the top of each heap is a live open node
+            for direction in [0, 1]:
+                heap = open_heaps[direction]
+                while heap and (heap[0][3] in closed_lists[direction] or
+                                heap[0][0] - heap[0][1] != g_values[direction][heap[0][3]]):
+                    heapq.heappop(heap)
+                heap = g_heaps[direction]
+                while heap and (heap[0][2] in closed_lists[direction] or
+                                heap[0][0] != g_values[direction][heap[0][2]]):
+                    heapq.heappop(heap)
+            if not open_heaps[0] or not open_heaps[1]:
+                finished = True
+                break
+            
+            # With a consistent heuristic, any route not yet found costs at least the smallest
+            #  f-value on either side. It also passes an open node of each side, so costs at
+            #  least their smallest g-values plus one move. Once the best route so far is no
+            #  more than these bounds it is optimal.
+            if best_cost is not None:
+                lower_bound = max(open_heaps[0][0][0], open_heaps[1][0][0],
+                                  g_heaps[0][0][0] + g_heaps[1][0][0] + ORTHOGONAL_COST)
+                if lower_bound >= best_cost:
+                    finished = True
+                    break
+            
+            # Expand the side with the smaller open heap, so the work is split evenly between
+            #  the two fronts. Choosing by f-value instead let one front grow across most of
+            #  the grid.
+            direction = 0 if len(open_heaps[0]) <= len(open_heaps[1]) else 1
+            other = 1 - direction
+            _, _, _, current = heapq.heappop(open_heaps[direction])
+            closed_lists[direction].add(current)
+            self.nodes_expanded += 1
+            
+            for dx in [-1,0,1]:
+                for dy in [-1,0,1]:
+                    if dx == 0 and dy == 0:
+                        continue
+                    neighbour = (current[0] + dx, current[1] + dy)
+                    if neighbour in closed_lists[direction] or not self.grid._is_traversable(neighbour):
+                        continue
+                    g_value = g_values[direction][current] + move_cost(dx, dy)
+                    if g_value >= g_values[direction].get(neighbour, g_value + 1):
+                        continue
+                    g_values[direction][neighbour] = g_value
+                    parents[direction][neighbour] = current
+                    h_value = octile_distance(neighbour, targets[direction])
+                    heapq.heappush(open_heaps[direction], (g_value + h_value, h_value, next(insertion_counter), neighbour))
+                    heapq.heappush(g_heaps[direction], (g_value, next(insertion_counter), neighbour))
+                    
+                    # The two searches meet if the other side has reached this node too
+                    if neighbour in g_values[other]:
+                        route_cost = g_value + g_values[other][neighbour]
+                        if best_cost is None or route_cost < best_cost:
+                            best_cost = route_cost
+                            meeting_node = neighbour
+                            
+        if meeting_node is None or not finished:
+            if finished:
+                print("There exists no valid route to destination!")
+            return []
+        
+        # Join the forward parent chain to the backward one at the meeting node
+        route = []
+        node = meeting_node
+        while node is not None:
+            route.insert(0, node)
+            node = parents[0][node]
+        node = parents[1][meeting_node]
+        while node is not None:
+            route.append(node)
+            node = parents[1][node]
+        return route
@@ -0,0 +1,207 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for the connected components of a grid. Every
+traversable node is labelled so that two nodes share a label only if a route exists
+between them, which lets a search with no possible route be rejected straight away.
+Labels are updated as single walls are added or removed, without relabelling the grid.
+"""
+from collections import deque
+import numpy as np
+
+class Components:
+    """
+    Class which labels the 8-connected regions of traversable nodes on a grid.
+    """
+    
+    #* >>> Constructor is called when components object is instantiated <<<
+    def __init__(self, dimensions: tuple[int], wall_mask: np.ndarray) -> None:
+        """
+        Inputs:
+            + dimensions -> The dimensions of the grid in number of nodes (x_dimension, y_dimension)
+            + wall_mask -> Flat bool array which is True at the grid index of every wall
+        """
+        self.dimensions = dimensions
+        number_of_nodes = dimensions[0] * dimensions[1]
+        self.labels = self._label(dimensions, wall_mask)
+        self.next_label = number_of_nodes # Labels of new components count up from here
+        self.merged_labels = {} # Label -> label of the component it was merged into
+        
+    #* >>> Labels every traversable node with the smallest grid index in its component <<<
+    @staticmethod
+    def _label(dimensions: tuple[int], wall_mask: np.ndarray) -> np.ndarray:
+        # Work is done on runs of traversable nodes along each row rather than on single
+        #  nodes, one pair of rows at a time, so memory stays close to the size of the labels
+        width, height = dimensions
+        number_of_nodes = width * height
+        index_type = np.int32 if number_of_nodes < 2**31 else np.int64
+        
+        # Find the first and last x of every run, numbering the runs in grid order
+        run_starts, run_ends, row_offsets = [], [], [0]
+        for y in range(height):
+            padded = np.concatenate(([False], ~wall_mask[y * width:(y + 1) * width], [False]))
+            edges = np.flatnonzero(padded[1:] != padded[:-1]).astype(index_type)
+            run_starts.append(edges[0::2])
+            run_ends.append(edges[1::2] - 1)
+            row_offsets.append(row_offsets[-1] + len(edges) // 2)
+        run_starts = np.concatenate(run_starts)
+        run_ends = np.concatenate(run_ends)
+        
+        # Union-find over runs. The larger root is always hooked onto the smaller, so the
+        #  root of each component is its first run in grid order.
+        parents = np.arange(len(run_starts), dtype=index_type)
+        def find(runs: np.ndarray) -> np.ndarray:
+            roots = parents[runs]
+            while True:
+                next_roots = parents[roots]
+                if np.array_equal(next_roots, roots):
+                    return roots
+                roots = next_roots
+                
+        for y in range(1, height):
+            above = slice(row_offsets[y - 1], row_offsets[y])
+            below = slice(row_offsets[y], row_offsets[y + 1])
+            # Runs in neighbouring rows touch, diagonals included, if they overlap once widened by one
+            first = np.searchsorted(run_ends[above], run_starts[below] - 1, side="left")
+            last = np.searchsorted(run_starts[above], run_ends[below] + 1, side="right")
+            counts = np.maximum(last - first, 0)
+            number_of_pairs = int(counts.sum())
+            if number_of_pairs == 0:
+                continue
+            below_runs = np.repeat(np.arange(row_offsets[y], row_offsets[y + 1], dtype=index_type), counts)
+            pair_offsets = np.arange(number_of_pairs, dtype=index_type) - np.repeat(np.cumsum(counts) - counts, counts)
+            above_runs = np.repeat(first, counts).astype(index_type) + pair_offsets + row_offsets[y - 1]
+            while True:
+                above_roots, below_roots = find(above_runs), find(below_runs)
+                differ = above_roots != below_roots
+                if not differ.any():
+                    break
+                np.minimum.at(parents, np.maximum(above_roots[differ], below_roots[differ]),
+                              np.minimum(above_roots[differ], below_roots[differ]))
+                
+        # Point every run straight at its root, whose first node has the smallest grid index
+        parents = find(np.arange(len(parents), dtype=index_type))
+        run_rows = np.repeat(np.arange(height, dtype=index_type), np.diff(row_offsets))
+        run_labels = run_rows[parents] * width + run_starts[parents]
+        
+        label_type = np.int32 if number_of_nodes < 2**30 else np.int64
+        labels = np.full(number_of_nodes, -1, dtype=label_type)
+        for y in range(height):
+            runs = slice(row_offsets[y], row_offsets[y + 1])
+            row = labels[y * width:(y + 1) * width]
+            row[~wall_mask[y * width:(y + 1) * width]] = np.repeat(run_labels[runs], run_ends[runs] - run_starts[runs] + 1)
+        return labels
+    
+    #* >>> Helper functions <<<
+    def _find(self, label: int) -> int:
+        # Follow merges to the label currently used by the component
+        while label in self.merged_labels:
+            label = self.merged_labels[label]
+        return label
+    
+    def label_of(self, index: int) -> int:
+        """
+        Returns:
+            + The component label of the node at a grid index, -1 for walls
+        """
+        label = int(self.labels[index])
+        return label if label < 0 else self._find(label)
+    
+    def connected(self, first_index: int, second_index: int) -> bool:
+        """
+        Returns:
+            + True if a route can exist between the two grid indices
+        """
+        first_label = self.label_of(first_index)
+        return first_label >= 0 and first_label == self.label_of(second_index)
+    
+    def _neighbours(self, index: int) -> list[int]:
+        # Grid indices of the traversable neighbours of a node
+        width, height = self.dimensions
+        x, y = index % width, index // width
+        neighbours = []
+        for dy in [-1,0,1]:
+            for dx in [-1,0,1]:
+                if (dx != 0 or dy != 0) and 0 <= x + dx < width and 0 <= y + dy < height:
+                    neighbour = index + dx + dy * width
+                    if self.labels[neighbour] >= 0:
+                        neighbours.append(neighbour)
+        return neighbours
+    
+    #* >>> Updates labels when a wall is removed <<<
+    def remove_wall(self, index: int) -> None:
+        neighbour_labels = {self.label_of(neighbour) for neighbour in self._neighbours(index)}
+        if len(neighbour_labels) == 0:
+            label = self.next_label
+            self.next_label += 1
+        else:
+            # Every component touching the node joins into one
+            label = min(neighbour_labels)
+            for other_label in neighbour_labels - {label}:
+                self.merged_labels[other_label] = label
+        self.labels[index] = label
+        
+    #* >>> Updates labels when a wall is added <<<
+    def add_wall(self, index: int) -> None:
+        self.labels[index] = -1
+        
+        # Group the remaining neighbours which still touch each other around the new wall
+        neighbours = self._neighbours(index)
+        width = self.dimensions[0]
+        groups = []
+        for neighbour in neighbours:
+            touching = [group for group in groups if any(
+                abs(neighbour % width - other % width) <= 1 and abs(neighbour // width - other // width) <= 1
+                for other in group)]
+            merged_group = [neighbour]
+            for group in touching:
+                groups.remove(group)
+                merged_group.extend(group)
+            groups.append(merged_group)
+        if len(groups) <= 1:
+            return
+        
+        # The groups may now be cut off from each other. Flood fill from each group in
+        #  turn, one node at a time, joining floods which meet. A flood which runs out of
+        #  nodes while others remain is a separate component and is given a new label.
+        #  Only the cut off parts are visited in full.
+        owners = {} # Grid index -> flood which reached it
+        flood_parents = list(range(len(groups)))
+        visited = []
+        queues = []
+        for flood, group in enumerate(groups):
+            visited.append(list(group))
+            queues.append(deque(group))
+            for node in group:
+                owners[node] = flood
+        
+        def find_flood(flood: int) -> int:
+            while flood_parents[flood] != flood:
+                flood = flood_parents[flood]
+            return flood
+        
+        active = list(range(len(groups)))
+        while len(active) > 1:
+            for flood in list(active):
+                if flood not in active or len(active) == 1:
+                    continue
+                if not queues[flood]:
+                    new_label = self.next_label
+                    self.next_label += 1
+                    self.labels[visited[flood]] = new_label
+                    active.remove(flood)
+                    continue
+                node = queues[flood].popleft()
+                for neighbour in self._neighbours(node):
+                    owner = owners.get(neighbour)
+                    if owner is None:
+                        owners[neighbour] = flood
+                        visited[flood].append(neighbour)
+                        queues[flood].append(neighbour)
+                        continue
+                    other = find_flood(owner)
+                    if other != flood:
+                        flood_parents[other] = flood
+                        visited[flood].extend(visited[other])
+                        queues[flood].extend(queues[other])
+                        active.remove(other)
@@ -0,0 +1,173 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for the D* Lite incremental planner. The search
+runs backwards from the end position, so its costs stay valid as the start moves along
+the route. When walls change only the nodes whose costs are affected are searched again,
+which makes replanning after small edits far cheaper than a fresh search. Moving onto a
+wall costs infinity, so adding or removing a wall only changes the costs of moves onto it.
+"""
+import heapq
+from itertools import count
+from Heuristics import octile_distance, step_cost
+
+INFINITY = float("inf")
+
+class DStarLite:
+    """
+    Class which keeps the search state of a D* Lite planner between replans.
+    """
+    
+    #* >>> Constructor is called when planner object is instantiated <<<
+    def __init__(self, grid, start_position: tuple[int], end_position: tuple[int]) -> None:
+        """
+        Inputs:
+            + grid -> The Grid to plan over, only its walls and dimensions are used
+            + start_position -> The grid coordinate of the route's starting point
+            + end_position -> The grid coordinate of the route's ending point, which is fixed
+        """
+        self.grid = grid
+        self.start_position = start_position
+        self.end_position = end_position
+        self.nodes_expanded = 0 # Number of nodes expanded by the last replan
+        
+        # g is the cost to the end found by the last expansion of each node, and rhs the
+        #  cost through its best neighbour. Nodes where these differ are inconsistent
+        #  and sit on the open heap. Missing entries are infinite.
+        self.g_values = {}
+        self.rhs_values = {end_position: 0}
+        # The heuristic is measured from the start, so moving the start would shrink the
+        #  keys already on the heap. Instead the distance moved is added to new keys.
+        self.key_modifier = 0
+        
+        # Priority queue as (key, insertion counter, coordinate). The current key of each
+        #  open node is kept in open_keys, and entries with any other key are skipped.
+        self.open_heap = []
+        self.open_keys = {}
+        self._heap_counter = count()
+        self._push_open(end_position)
+        
+    # Helper function giving the neighbours of a coordinate which are inside the grid
+    def _neighbours(self, coordinate: tuple[int]) -> list[tuple]:
+        neighbours = []
+        for dx in [-1,0,1]:
+            for dy in [-1,0,1]:
+                if dx == 0 and dy == 0:
+                    continue
+                neighbour = (coordinate[0] + dx, coordinate[1] + dy)
+                if self.grid._check_coordinate_in_bounds(neighbour):
+                    neighbours.append(neighbour)
+        return neighbours
+    
+    # Helper function giving the cost of moving between two neighbouring coordinates
+    def _move_cost(self, source: tuple[int], target: tuple[int]) -> float:
+        if not self.grid._is_traversable(target):
+            return INFINITY
+        return step_cost(source, target)
+    
+    # Helper function giving the priority of a node on the open heap
+    def _calculate_key(self, coordinate: tuple[int]) -> tuple:
+        cost = min(self.g_values.get(coordinate, INFINITY), self.rhs_values.get(coordinate, INFINITY))
+        return (cost + octile_distance(self.start_position, coordinate) + self.key_modifier, cost)
+    
+    #* >>> Adds a node to the priority queue with its current key <<<
+    def _push_open(self, coordinate: tuple[int]) -> None:
+        key = self._calculate_key(coordinate)
+        self.open_keys[coordinate] = key
+        heapq.heappush(self.open_heap, (key, next(self._heap_counter), coordinate))
+        
+    #* >>> Drops outdated entries so the top of the heap is a live open node <<<
+    def _clean_top(self) -> None:
+        while self.open_heap and self.open_keys.get(self.open_heap[0][2]) != self.open_heap[0][0]:
+            heapq.heappop(self.open_heap)
+    
+    #* >>> Recalculates a node's cost through its best neighbour and updates its open status <<<
+    def _update_node(self, coordinate: tuple[int]) -> None:
+        if coordinate != self.end_position:
+            self.rhs_values[coordinate] = min([self._move_cost(coordinate, neighbour) + self.g_values.get(neighbour, INFINITY)
+                                               for neighbour in self._neighbours(coordinate)], default=INFINITY)
+        if self.g_values.get(coordinate, INFINITY) != self.rhs_values[coordinate]:
+            self._push_open(coordinate)
+        else:
+            self.open_keys.pop(coordinate, None)
+            
+    #* >>> Expands inconsistent nodes until the start's cost is known <<<
+    def _compute_shortest_path(self, max_iter: int) -> bool:
+        """
+        Inputs:
+            + max_iter -> The maximum number of nodes that will be expanded
+        Returns:
+            + False if max_iter was reached before the start's cost was known
+        """
+        self.nodes_expanded = 0
+        while True:
+            self._clean_top()
+            start_rhs = self.rhs_values.get(self.start_position, INFINITY)
+            start_g = self.g_values.get(self.start_position, INFINITY)
+            if not self.open_heap or (self.open_heap[0][0] >= self._calculate_key(self.start_position) and start_rhs == start_g):
+                return True
+            if self.nodes_expanded >= max_iter:
+                return False
+            
+            old_key, _, current = heapq.heappop(self.open_heap)
+            del self.open_keys[current]
+            self.nodes_expanded += 1
+            
+            new_key = self._calculate_key(current)
+            if old_key < new_key:
+                # The key was made with an older start position, so requeue it
+                self._push_open(current)
+            elif self.g_values.get(current, INFINITY) > self.rhs_values[current]:
+                # The node's cost has dropped, which may lower its neighbours' costs
+                self.g_values[current] = self.rhs_values[current]
+                for neighbour in self._neighbours(current):
+                    self._update_node(neighbour)
+            else:
+                # The node's cost has risen, so it and its neighbours are recalculated
+                self.g_values[current] = INFINITY
+                self._update_node(current)
+                for neighbour in self._neighbours(current):
+                    self._update_node(neighbour)
+                    
+    #* >>> Marks the costs around a position as changed after a wall is placed or removed <<<
+    def update_wall(self, wall_position: tuple[int]) -> None:
+        """
+        Inputs:
+            + wall_position -> The (x,y) coordinate whose wall has changed
+        """
+        # Only the cost of moving onto the position changes, which affects its neighbours
+        for neighbour in self._neighbours(wall_position):
+            self._update_node(neighbour)
+            
+    #* >>> Moves the start of the route, keeping the search state <<<
+    def move_start(self, start_position: tuple[int]) -> None:
+        """
+        Inputs:
+            + start_position -> The new grid coordinate of the route's starting point
+        """
+        self.key_modifier += octile_distance(self.start_position, start_position)
+        self.start_position = start_position
+        
+    #* >>> Repairs the search and returns the current optimal route <<<
+    def find_route(self, max_iter: int = 10000) -> list[tuple]:
+        """
+        Inputs:
+            + max_iter -> The maximum number of nodes that will be expanded
+        Returns:
+            + Coordinates of nodes in the optimal route, ordered from start node to end node.
+              This is empty if no route was found.
+        """
+        if not self._compute_shortest_path(max_iter):
+            return []
+        if self.g_values.get(self.start_position, INFINITY) == INFINITY and self.start_position != self.end_position:
+            print("There exists no valid route to destination!")
+            return []
+        
+        # Walk downhill from the start, always moving to the neighbour with the lowest cost to the end
+        route = [self.start_position]
+        current = self.start_position
+        while current != self.end_position:
+            current = min(self._neighbours(current),
+                          key=lambda neighbour: self._move_cost(current, neighbour) + self.g_values.get(neighbour, INFINITY))
+            route.append(current)
+        return route
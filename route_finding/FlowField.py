@@ -0,0 +1,107 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for the flow field. The cost of the cheapest route
+to one end position is found for every position in the grid at once, so any number of
+routes to that end are then found by stepping downhill from their start.
+"""
+import heapq
+import numpy as np
+from Heuristics import move_cost, UNREACHABLE
+
+class FlowField:
+    """
+    Class which holds the cost to one end position from every position in the grid.
+    """
+    
+    #* >>> Constructor is called when flow field object is instantiated <<<
+    def __init__(self, wall_mask: np.ndarray, dimensions: tuple[int], end_position: tuple[int]) -> None:
+        """
+        Inputs:
+            + wall_mask -> A flat array which is True at the grid index of every wall
+            + dimensions -> The dimensions of the grid in number of nodes (x_dimension, y_dimension)
+            + end_position -> The grid coordinate every route leads to
+        """
+        self.wall_mask = wall_mask
+        self.dimensions = dimensions
+        self.end_position = end_position
+        self.costs = np.full(dimensions[0] * dimensions[1], UNREACHABLE, dtype=np.int32)
+        self._calculate_costs()
+        
+    #* >>> Spreads costs out from the end position as a wavefront <<<
+    def _calculate_costs(self) -> None:
+        # Moves have only two costs, so nodes are settled in batches of equal cost. Each
+        #  batch is expanded over all eight directions at once.
+        x_dimension, y_dimension = self.dimensions
+        end_index = self.end_position[1] * x_dimension + self.end_position[0]
+        self.costs[end_index] = 0
+        if self.wall_mask[end_index]:
+            # No route may move onto a wall, so only a route starting at the end exists
+            return
+        
+        batches = {0: [np.array([end_index])]}
+        batch_costs = [0]
+        while batch_costs:
+            cost = heapq.heappop(batch_costs)
+            indices = np.unique(np.concatenate(batches.pop(cost)))
+            # Drop nodes which reached a lower cost after being added to this batch
+            indices = indices[self.costs[indices] == cost]
+            x_values = indices % x_dimension
+            y_values = indices // x_dimension
+            
+            for dx in [-1,0,1]:
+                for dy in [-1,0,1]:
+                    if dx == 0 and dy == 0:
+                        continue
+                    in_bounds = ((x_values + dx >= 0) & (x_values + dx < x_dimension) &
+                                 (y_values + dy >= 0) & (y_values + dy < y_dimension))
+                    neighbours = indices[in_bounds] + dy * x_dimension + dx
+                    new_cost = cost + move_cost(dx, dy)
+                    neighbours = neighbours[self.costs[neighbours] > new_cost]
+                    # Walls get a cost, since a route may start on one, but are never passed through
+                    self.costs[neighbours] = new_cost
+                    neighbours = neighbours[~self.wall_mask[neighbours]]
+                    if len(neighbours) == 0:
+                        continue
+                    if new_cost not in batches:
+                        batches[new_cost] = []
+                        heapq.heappush(batch_costs, new_cost)
+                    batches[new_cost].append(neighbours)
+                    
+    #* >>> Returns the cost of the cheapest route from a position to the end <<<
+    def cost_from(self, start_position: tuple[int]) -> int:
+        return int(self.costs[start_position[1] * self.dimensions[0] + start_position[0]])
+    
+    #* >>> Returns the cheapest route from a position to the end <<<
+    def route_from(self, start_position: tuple[int]) -> list[tuple]:
+        """
+        Inputs:
+            + start_position -> The grid coordinate of the route's starting point
+        Returns:
+            + Coordinates of nodes in the optimal route, ordered from start node to end node.
+              This is empty if there is no route.
+        """
+        if self.cost_from(start_position) == UNREACHABLE:
+            return []
+        
+        # Step to whichever neighbour's cost plus the cost of moving there is lowest
+        x_dimension, y_dimension = self.dimensions
+        route = [start_position]
+        current = start_position
+        while current != self.end_position:
+            best_cost = None
+            for dx in [-1,0,1]:
+                for dy in [-1,0,1]:
+                    x, y = current[0] + dx, current[1] + dy
+                    if (dx == 0 and dy == 0) or x < 0 or x >= x_dimension or y < 0 or y >= y_dimension:
+                        continue
+                    index = y * x_dimension + x
+                    if self.wall_mask[index] or self.costs[index] == UNREACHABLE:
+                        continue
+                    cost = int(self.costs[index]) + move_cost(dx, dy)
+                    if best_cost is None or cost < best_cost:
+                        best_cost = cost
+                        best_neighbour = (x, y)
+            current = best_neighbour
+            route.append(current)
+        return route
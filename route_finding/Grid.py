@@ -6,7 +6,24 @@ This file contains the class definition for the grid. This defines the size of t
 the position of any obstructive terrain, and holds all nodes. Furthermore,
 the route-finding methods are defined on this grid.
 """
+import heapq
+import os
+from collections import OrderedDict
+from time import perf_counter
+from multiprocessing import Pool, shared_memory
+import numpy as np
 from Node import Node
+from ArrayStorage import ArrayStorage, MAX_F_VALUE
+from JumpPointSearch import JumpPointSearch
+from Components import Components
+from Hierarchy import Hierarchy
+from BidirectionalSearch import BidirectionalSearch
+from DStarLite import DStarLite
+from AnytimeSearch import AnytimeSearch
+from RouteCache import RouteCache
+from FlowField import FlowField
+from Heuristics import squared_euclidean_distance, octile_distance, move_cost, LandmarkHeuristic, \
+    ORTHOGONAL_COST, DIAGONAL_COST
 
 class Grid:
     """
@@ -30,25 +47,87 @@ class Grid:
             in_bounds=False
             
         return in_bounds
+    
+    # Helper function to check that a given coordinate is in bounds and not a wall
+    def _is_traversable(self, coordinate: tuple[int]) -> bool:
+        if not self._check_coordinate_in_bounds(coordinate):
+            return False
+        node = self.grid[self._index_from_coordinate(coordinate)]
+        return node is None or node.traversable
         
     #* >>> Constructor is called when grid object is instantiated <<<
-    def __init__(self, dimensions: tuple[int], wall_positions: list[tuple[int]] = None) -> None:
+    def __init__(self, dimensions: tuple[int], wall_positions: list[tuple[int]] = None,
+                 storage: str = "nodes", track_components: bool = True, route_cache_size: int = 0,
+                 heuristic: str = "euclidean", instrument: bool = False) -> None:
         """
         Inputs:
             + dimensions -> The dimensions of the grid in number of nodes (x_dimension, y_dimension)
             + wall_positions -> A list of (x,y) coordinates to place walls (impassable nodes)
+            + storage -> How nodes are stored, either "nodes" for a list of Node objects or
+                         "arrays" for flat numpy arrays, which use far less memory on large grids
+            + track_components -> If True the connected regions of the grid are labelled on the
+                                  first search, so searches between unconnected positions
+                                  return straight away
+            + route_cache_size -> The number of routes kept so repeated searches are answered
+                                  without searching again. Set to 0 to disable the cache.
+            + heuristic -> The estimate of remaining cost used by A* searches, one of
+                            + euclidean -> Squared straight-line distance (default). This overestimates
+                                           costs, so routes are found quickly but may not be optimal.
+                            + octile -> The route cost if there were no walls, giving optimal routes
+                            + alt -> Bounds from precomputed costs to landmarks, giving optimal
+                                     routes with far fewer expansions on maps with many walls.
+                                     See build_landmarks.
+            + instrument -> If True, statistics of each search are kept in search_stats
         """
         
+        if storage not in ("nodes", "arrays"):
+            print(f"Storage {storage} not recognised! Exiting...")
+            exit(2)
+        if heuristic not in ("euclidean", "octile", "alt"):
+            print(f"Heuristic {heuristic} not recognised! Exiting...")
+            exit(2)
+        self.storage = storage
         self.dimensions = dimensions
         self.grid = None
+        self.track_components = track_components
+        self.components = None
+        self.hierarchy = None # Sector abstraction used by hierarchical searches, built when first needed
+        self.sector_size = 16 # Sector size the hierarchy is built with, kept for rebuilds after reset_grid
+        self.heuristic = heuristic
+        self.landmarks = None # Landmark heuristic used when heuristic is "alt", built when first needed
+        self.number_of_landmarks = 8
+        self.landmark_cache_directory = None
+        # True once walls have been edited one at a time since the last reset_grid
+        self.walls_edited = False
+        self.search_heuristic = squared_euclidean_distance # Heuristic function of the current A* search
         
         self.start_position = None
         self.end_position = None
         
-        self.current_node = None
+        # Every search has a new id, which is stamped on each node it reaches. Values on
+        #  nodes with an older stamp are left over from earlier searches and are ignored,
+        #  so the grid never needs clearing between searches.
+        self.search_id = 0
+        self.jump_point_search = None # The last jump point search run on the grid
+        self.bidirectional_search = None # The last bidirectional search run on the grid
+        self.incremental_planner = None # D* Lite planner kept between incremental searches
+        self.anytime_search = None # The last anytime search run on the grid
+        
+        # Statistics of the last search when instrument is True. These are the nodes expanded,
+        #  the largest size of the open list, the number of decrease-keys (open nodes given a
+        #  lower cost, since expanded nodes are never reopened), and the seconds spent in
+        #  each phase. Values a search mode does not
+        #  report are None.
+        self.instrument = instrument
+        self.search_stats = None
+        self.route_cache = RouteCache(route_cache_size) if route_cache_size > 0 else None
+        # Flow fields by end position, ordered from least to most recently used
+        self.flow_fields = OrderedDict()
+        self.max_flow_fields = 16
         
-        self.open_list = set() # Grid indices of nodes which are under consideration
-        self.closed_list = set() # Grid indices of nodes which have already been considered
+        # Flat arrays holding the walls and the values of A* searches when storage is "nodes".
+        #  With "arrays" storage the grid's own arrays are used.
+        self.search_arrays = None
         
         # Create the grid
         self.reset_grid(wall_positions)
@@ -60,11 +139,15 @@ class Grid:
             + wall_positions -> A list of (x,y) coordinates to place walls (impassable nodes)
         """
         
-        # Initialise the grid as a list of None's
-        self.grid = []
-        # Collapsing the coordinates to one-dimensional index to avoid double loop
-        for index in range(self.dimensions[0] * self.dimensions[1]):
-            self.grid.append(None)
+        if self.storage == "arrays":
+            # Flat arrays which hand out views of each node
+            self.grid = ArrayStorage(self.dimensions)
+        else:
+            # Initialise the grid as a list of None's
+            self.grid = []
+            # Collapsing the coordinates to one-dimensional index to avoid double loop
+            for index in range(self.dimensions[0] * self.dimensions[1]):
+                self.grid.append(None)
             
         # Add walls to the grid in the specified locations
         if wall_positions is not None:
@@ -74,126 +157,567 @@ class Grid:
                     exit(2)
                 wall_index = self._index_from_coordinate(wall_coord)
                 self.grid[wall_index] = Node(wall_coord, traversable=False)
-               
-    #* >>> Sets the start and end positions <<<
-    def _set_start_end_positions(self, start_position: tuple[int], end_position: tuple[int]) -> None:
+                
+        # The sector abstraction and search arrays are rebuilt for the new walls when next needed
+        self.hierarchy = None
+        self.search_arrays = None
+        # Every cost may have changed, so incremental planning starts afresh
+        self.incremental_planner = None
+        self.landmarks = None
+        self.walls_edited = False
+        if self.route_cache is not None:
+            self.route_cache.clear()
+        self.flow_fields.clear()
+        
+        # The connected regions are labelled for the new walls when first needed
+        self.components = None
+            
+    #* >>> Returns a flat array which is True at the grid index of every wall <<<
+    def _wall_mask(self) -> np.ndarray:
+        if self.storage == "arrays":
+            return self.grid.wall_mask()
+        return np.array([node is not None and not node.traversable for node in self.grid], dtype=bool)
+    
+    #* >>> Places a wall at a single position <<<
+    def add_wall(self, wall_position: tuple[int]) -> None:
         """
         Inputs:
-            + start_position -> (x,y) grid coordinates of where to begin route
-            + end_position -> (x,y) grid coordinates of where to end route
+            + wall_position -> The (x,y) coordinate to place a wall
         """
-        
-        # Check the positions are within the bounds of the grid
+        if not self._check_coordinate_in_bounds(wall_position):
+            print(f"Wall coordinate {wall_position} is out of bounds! Exiting...")
+            exit(2)
+        if not self._is_traversable(wall_position):
+            return
+        wall_index = self._index_from_coordinate(wall_position)
+        self.grid[wall_index] = Node(wall_position, traversable=False)
+        if self.search_arrays is not None:
+            self.search_arrays.set_wall(wall_index, True)
+        if self.components is not None:
+            self.components.add_wall(wall_index)
+        if self.hierarchy is not None:
+            self.hierarchy.update_wall(wall_position)
+        if self.incremental_planner is not None:
+            self.incremental_planner.update_wall(wall_position)
+        if self.route_cache is not None:
+            self.route_cache.update_wall(wall_position, wall_added=True)
+        self.flow_fields.clear()
+        # Landmark costs may no longer bound route costs, so they are found again when next needed
+        self.landmarks = None
+        self.walls_edited = True
+            
+    #* >>> Removes the wall at a single position <<<
+    def remove_wall(self, wall_position: tuple[int]) -> None:
+        """
+        Inputs:
+            + wall_position -> The (x,y) coordinate of the wall to remove
+        """
+        if not self._check_coordinate_in_bounds(wall_position):
+            print(f"Wall coordinate {wall_position} is out of bounds! Exiting...")
+            exit(2)
+        if self._is_traversable(wall_position):
+            return
+        wall_index = self._index_from_coordinate(wall_position)
+        if self.storage == "arrays":
+            self.grid.set_wall(wall_index, False)
+        else:
+            self.grid[wall_index] = None
+        if self.search_arrays is not None:
+            self.search_arrays.set_wall(wall_index, False)
+        if self.components is not None:
+            self.components.remove_wall(wall_index)
+        if self.hierarchy is not None:
+            self.hierarchy.update_wall(wall_position)
+        if self.incremental_planner is not None:
+            self.incremental_planner.update_wall(wall_position)
+        if self.route_cache is not None:
+            self.route_cache.update_wall(wall_position, wall_added=False)
+        self.flow_fields.clear()
+        # Landmark costs may no longer bound route costs, so they are found again when next needed
+        self.landmarks = None
+        self.walls_edited = True
+            
+    #* >>> Moves the start of the incremental route and replans from the new position <<<
+    def move_start(self, start_position: tuple[int], max_iter: int = 10000) -> list[tuple]:
+        """
+        Inputs:
+            + start_position -> The new grid coordinate of the route's starting point
+            + max_iter -> The maximum number of nodes that will be expanded while replanning
+        Returns:
+            + Coordinates of nodes in the optimal route from the new start to the end.
+              This is empty if no route was found.
+        """
+        if self.incremental_planner is None:
+            print("No incremental route to move the start of! Exiting...")
+            exit(2)
+        return self.find_route(start_position, self.incremental_planner.end_position, max_iter, mode="incremental")
+               
+    #* >>> Exits if a route's start or end position is outside the grid <<<
+    def _check_route_in_bounds(self, start_position: tuple[int], end_position: tuple[int]) -> None:
         if not self._check_coordinate_in_bounds(start_position):
             print(f"Start position {start_position} placed out of bounds. Exiting...")
             exit(2)
         if not self._check_coordinate_in_bounds(end_position):
             print(f"End position {end_position} placed out of bounds. Exiting...")
             exit(2)
+            
+    #* >>> Sets the start and end positions <<<
+    def _set_start_end_positions(self, start_position: tuple[int], end_position: tuple[int]) -> None:
+        """
+        Inputs:
+            + start_position -> (x,y) grid coordinates of where to begin route
+            + end_position -> (x,y) grid coordinates of where to end route
+        """
+        
+        self._check_route_in_bounds(start_position, end_position)
                 
         self.start_position = start_position
         self.end_position = end_position
         
-        # Create node in start position and add to open list
-        start_index = self._index_from_coordinate(start_position)
-        self.grid[start_index] = Node(start_position)
-        self.grid[start_index].g_value = 0
-        self.grid[start_index].f_value = 0
-        self.grid[start_index].f_value = 0
-        self.open_list.add(start_index) 
-        
-    #* >>> Method which searches neighbours of the current node and updates their open/closed list status <<<
-    def _update_neighbours(self) -> None:
+        # Start a new search, so values left on nodes by earlier searches are ignored
+        self.search_id += 1
+        
+    #* >>> Returns the flat arrays which hold the walls and the values of A* searches <<<
+    def _search_arrays(self) -> ArrayStorage:
+        if self.storage == "arrays":
+            return self.grid
+        if self.search_arrays is None:
+            # Built on the first search, then kept up to date as walls are edited
+            self.search_arrays = ArrayStorage(self.dimensions, wall_bits=np.packbits(self._wall_mask()))
+        return self.search_arrays
     
-        # Loop over neighbours
-        x_current, y_current = self.current_node.position
-        for dx in [-1,0,1]:
-            for dy in [-1,0,1]:
-                
-                x_neighbour = x_current + dx
-                y_neighbour = y_current + dy
-                index_neighbour = self._index_from_coordinate((x_neighbour, y_neighbour))
-                
-                # Check neighbour is within the bounds of the grid
-                if not self._check_coordinate_in_bounds((x_neighbour, y_neighbour)):
-                    continue
-                
-                # Add node object to grid if it does not yet exist. I only add nodes
-                #  as objects if they need checking to save memory on large grids
-                if self.grid[index_neighbour] is None:
-                    self.grid[index_neighbour] = Node((x_neighbour, y_neighbour))
-                
-                # Ignore non-traversable nodes
-                if not self.grid[index_neighbour].traversable:
+    #* >>> Runs an A* search from the start position until the end node is expanded <<<
+    def _run_astar(self, max_iter: int) -> bool:
+        """
+        Inputs:
+            + max_iter -> The maximum number of nodes that will be expanded
+        Returns:
+            + True if the end node was expanded
+        """
+        
+        # Nodes are handled by grid index, and their values are read and written in place
+        #  in the flat arrays, so no objects are made for each node reached. Values in the
+        #  arrays are stored plus one, and costs are kept that way throughout.
+        width, height = self.dimensions
+        arrays = self._search_arrays()
+        arrays.start_search(self.search_id)
+        walls = memoryview(arrays.wall_bits)
+        reached = memoryview(arrays.reached_bits)
+        g_values = memoryview(arrays.g_values)
+        f_values = memoryview(arrays.f_values)
+        parents = memoryview(arrays.parents)
+        closed = bytearray(len(arrays.reached_bits))
+        max_f = MAX_F_VALUE + 1
+        
+        end_x, end_y = self.end_position
+        end_index = self._index_from_coordinate(self.end_position)
+        heuristic = self.search_heuristic
+        use_octile = heuristic is octile_distance
+        use_euclidean = heuristic is squared_euclidean_distance
+        
+        # Each open list entry is one integer ordering nodes by f, then h, then grid index
+        index_bits = len(arrays).bit_length()
+        index_mask = (1 << index_bits) - 1
+        f_shift = index_bits + 31
+        # (dx, dy, grid index offset, cost) of each move
+        moves = [(dx, dy, dx + dy * width, move_cost(dx, dy))
+                 for dy in [-1,0,1] for dx in [-1,0,1] if dx != 0 or dy != 0]
+        diagonal_extra = DIAGONAL_COST - ORTHOGONAL_COST
+        
+        start_index = self._index_from_coordinate(self.start_position)
+        h_value = min(heuristic(self.start_position, self.end_position), MAX_F_VALUE)
+        reached[start_index >> 3] |= 128 >> (start_index & 7)
+        g_values[start_index] = 1
+        f_values[start_index] = min(1 + h_value, max_f)
+        parents[start_index] = 0
+        open_heap = [(f_values[start_index] << f_shift) | (h_value << index_bits) | start_index]
+        
+        nodes_expanded = 0
+        open_size = open_size_peak = 1
+        decreases = 0
+        found = False
+        while nodes_expanded < max_iter:
+            if not open_heap:
+                print("There exists no valid route to destination!")
+                break
+            
+            # Take the lowest cost node, skipping entries for nodes already expanded or
+            #  whose f-value has since dropped
+            entry = heapq.heappop(open_heap)
+            index = entry & index_mask
+            byte, bit = index >> 3, 128 >> (index & 7)
+            if closed[byte] & bit or entry >> f_shift != f_values[index]:
+                continue
+            closed[byte] |= bit
+            open_size -= 1
+            nodes_expanded += 1
+            if index == end_index:
+                found = True
+                break
+            
+            # Reach every traversable neighbour, or lower its cost if this route to it is cheaper
+            x, y = index % width, index // width
+            g_value = g_values[index]
+            for dx, dy, offset, cost in moves:
+                x_neighbour, y_neighbour = x + dx, y + dy
+                if x_neighbour < 0 or x_neighbour >= width or y_neighbour < 0 or y_neighbour >= height:
                     continue
-                # Ignore nodes on the closed list
-                if index_neighbour in self.closed_list:
+                neighbour = index + offset
+                byte, bit = neighbour >> 3, 128 >> (neighbour & 7)
+                if walls[byte] & bit:
                     continue
-                
-                # Add node to open list if not already present
-                if index_neighbour not in self.open_list:
-                    self.open_list.add(index_neighbour)
-                    self.grid[index_neighbour].calculate_cost(self.current_node, self.end_position)
+                new_g_value = g_value + cost
+                if reached[byte] & bit:
+                    if closed[byte] & bit or new_g_value >= g_values[neighbour]:
+                        continue
+                    decreases += 1
+                else:
+                    reached[byte] |= bit
+                    open_size += 1
+                if use_octile:
+                    x_distance, y_distance = abs(x_neighbour - end_x), abs(y_neighbour - end_y)
+                    h_value = (ORTHOGONAL_COST * x_distance + diagonal_extra * y_distance if x_distance > y_distance
+                               else ORTHOGONAL_COST * y_distance + diagonal_extra * x_distance)
+                elif use_euclidean:
+                    h_value = min((x_neighbour - end_x)**2 + (y_neighbour - end_y)**2, MAX_F_VALUE)
                 else:
-                    # Update neighbours values if path to it via current node is more optimal
-                    #  than via its current parent
-                    self.grid[index_neighbour].check_new_parent(self.current_node)    
+                    h_value = heuristic((x_neighbour, y_neighbour), self.end_position)
+                f_value = min(new_g_value + h_value, max_f)
+                g_values[neighbour] = new_g_value
+                f_values[neighbour] = f_value
+                parents[neighbour] = index + 1
+                heapq.heappush(open_heap, (f_value << f_shift) | (h_value << index_bits) | neighbour)
+            if open_size > open_size_peak:
+                open_size_peak = open_size
+                
+        if self.search_stats is not None:
+            self.search_stats.update(nodes_expanded=nodes_expanded, open_list_peak=open_size_peak,
+                                     decrease_keys=decreases)
+        return found
+    
+    #* >>> Returns the route to the end position by tracing back through the parents of the last A* search <<<
+    def _trace_route(self) -> list[tuple]:
+        arrays = self._search_arrays()
+        index = self._index_from_coordinate(self.end_position)
+        parents = memoryview(arrays.parents)
+        route = []
+        while index >= 0:
+            route.append(self._coordinate_from_index(index))
+            index = parents[index] - 1
+        route.reverse()
+        return route
             
+    #* >>> Precomputes the sector abstraction used by hierarchical searches <<<
+    def build_hierarchy(self, sector_size: int = 16) -> None:
+        """
+        Inputs:
+            + sector_size -> The width and height of each sector in nodes. Larger sectors
+                             give a smaller abstract graph but cost more to build and refine.
+        """
+        self.sector_size = sector_size
+        self.hierarchy = Hierarchy(self, sector_size)
+        
+    #* >>> Precomputes the landmark costs used by the "alt" heuristic <<<
+    def build_landmarks(self, number_of_landmarks: int = 8, cache_directory: str | None = None) -> None:
+        """
+        Inputs:
+            + number_of_landmarks -> The number of landmarks, more give tighter estimates but use more memory
+            + cache_directory -> Where landmark costs are saved, so later grids with the same walls
+                                 load them from disk. None turns off caching.
+        """
+        self.number_of_landmarks = number_of_landmarks
+        self.landmark_cache_directory = cache_directory
+        self.landmarks = LandmarkHeuristic.build(self._wall_mask(), self.dimensions, number_of_landmarks,
+                                                 cache_directory)
+        
+    #* >>> Returns the function estimating the cost between two positions <<<
+    def _heuristic_function(self):
+        if self.heuristic == "octile":
+            return octile_distance
+        if self.heuristic == "alt":
+            if self.landmarks is None:
+                # Every wall edit would otherwise leave another table in the cache directory,
+                #  so landmarks rebuilt after edits are kept in memory only
+                cache_directory = None if self.walls_edited else self.landmark_cache_directory
+                self.landmarks = LandmarkHeuristic.build(self._wall_mask(), self.dimensions,
+                                                         self.number_of_landmarks, cache_directory)
+            return self.landmarks
+        return squared_euclidean_distance
+    
+    #* >>> Returns the flow field of costs to an end position, calculating it if not cached <<<
+    def flow_field(self, end_position: tuple[int]) -> FlowField:
+        """
+        Inputs:
+            + end_position -> The grid coordinate every route leads to
+        Returns:
+            + The flow field for end_position, which is kept until the walls change
+        """
+        if not self._check_coordinate_in_bounds(end_position):
+            print(f"End position {end_position} placed out of bounds. Exiting...")
+            exit(2)
+        if end_position in self.flow_fields:
+            self.flow_fields.move_to_end(end_position)
+        else:
+            if len(self.flow_fields) >= self.max_flow_fields:
+                self.flow_fields.popitem(last=False)
+            self.flow_fields[end_position] = FlowField(self._wall_mask(), self.dimensions, end_position)
+        return self.flow_fields[end_position]
+    
+    #* >>> Checks whether a route could exist between two positions <<<
+    def _may_be_connected(self, start_position: tuple[int], end_position: tuple[int]) -> bool:
+        for position in [start_position, end_position]:
+            if not self._check_coordinate_in_bounds(position):
+                # Left for _set_start_end_positions to report
+                return True
+        # No route can end on a wall, which would otherwise be found only once every node
+        #  reachable from the start had been expanded
+        if not self._is_traversable(end_position):
+            return False
+        if not self.track_components:
+            return True
+        if self.components is None:
+            # Labelled on the first search, so building a grid stays cheap
+            self.components = Components(self.dimensions, self._wall_mask())
+        start_index = self._index_from_coordinate(start_position)
+        end_index = self._index_from_coordinate(end_position)
+        # A route may begin on a wall, in which case any neighbour's component could be used
+        if self.components.label_of(start_index) < 0:
+            return True
+        return self.components.connected(start_index, end_index)
+    
     #* >>> Method which finds the shortest route between start and end positions <<<
     def find_route(self, start_position: tuple[int], end_position: tuple[int],
-                   max_iter: int = 10000) -> list[tuple]:
+                   max_iter: int = 10000, mode: str = "astar", time_limit: float | None = None) -> list[tuple]:
         """
         Inputs:
             + start_position -> The grid coordinate of the route's starting point
             + end_position -> The grid coordinate of hte route's ending point
             + max_iter -> The maximum number of iterations that the route finder will run for
+            + mode -> The search used, one of
+                        + astar -> A* search over every neighbour (default)
+                        + jps -> Jump point search, which finds an optimal cost route
+                                 while expanding far fewer nodes on open grids
+                        + hierarchical -> Searches a precomputed abstraction of the grid's
+                                          sectors (HPA*), giving a near-optimal route quickly
+                                          over long distances. See build_hierarchy.
+                        + bidirectional -> A* from both ends at once, joined where the two
+                                           searches meet, which finds an optimal cost route
+                        + incremental -> D* Lite, which finds an optimal cost route and keeps its
+                                         search state, so later searches to the same end after
+                                         add_wall, remove_wall or move_start only repair the
+                                         part of the search that changed
+                        + flow -> Follows a flow field of costs to the end position, which gives
+                                  optimal cost routes. The field is found once per end and
+                                  cached, so many routes to the same end are quick.
+                        + anytime -> Anytime repairing A* (ARA*), which finds a route quickly with
+                                     an inflated heuristic and improves it until max_iter
+                                     expansions or time_limit run out. The bound on how far
+                                     the route is from optimal is kept in
+                                     anytime_search.suboptimality_bound.
+            + time_limit -> The most seconds an anytime search will run for, None for no limit
         Returns:
-            + Coordinates of nodes in the optimal route, ordered from start node to end node
+            + Coordinates of nodes in the optimal route, ordered from start node to end node.
+              This is empty if the end node was not reached, or if an A* or bidirectional
+              search ran out of max_iter before its route was known to be the best.
         """
         
-        # <<< 1) Set the start and end positions of the route >>>
-        self._set_start_end_positions(start_position, end_position)
+        if self.instrument:
+            self.search_stats = {"mode": mode, "nodes_expanded": None, "open_list_peak": None,
+                                 "decrease_keys": None, "cache_hit": False, "phase_seconds": {}}
+        search_start = perf_counter()
+        
+        # Anytime routes depend on the budget given and set anytime_search.suboptimality_bound,
+        #  so they are always searched for rather than cached
+        route_cache = self.route_cache if mode != "anytime" else None
+        route = None
+        if route_cache is not None:
+            route = route_cache.get(start_position, end_position, mode)
+            if self.search_stats is not None:
+                self.search_stats["cache_hit"] = route is not None
+        if route is None:
+            route = self._search_route(start_position, end_position, max_iter, mode, time_limit)
+            if route_cache is not None:
+                route_cache.put(start_position, end_position, mode, route)
+                
+        self._record_phase("total", search_start)
+        return route
+    
+    #* >>> Records the time since phase_start as the time of a search phase <<<
+    def _record_phase(self, phase: str, phase_start: float) -> float:
+        """
+        Inputs:
+            + phase -> The name of the phase in search_stats
+            + phase_start -> The perf_counter() value when the phase began
+        Returns:
+            + The perf_counter() value now, which is when the next phase begins
+        """
+        now = perf_counter()
+        if self.search_stats is not None:
+            self.search_stats["phase_seconds"][phase] = now - phase_start
+        return now
+    
+    #* >>> Records the number of nodes a search expanded <<<
+    def _record_nodes_expanded(self, nodes_expanded: int) -> None:
+        if self.search_stats is not None:
+            self.search_stats["nodes_expanded"] = nodes_expanded
+    
+    #* >>> Runs the search for find_route <<<
+    def _search_route(self, start_position: tuple[int], end_position: tuple[int],
+                      max_iter: int, mode: str, time_limit: float | None) -> list[tuple]:
         
+        # Reject the search straight away if no route can exist
+        if not self._may_be_connected(start_position, end_position):
+            print("There exists no valid route to destination!")
+            return []
         
-        # <<< 2) Loop over cells to reach destination >>>
-        iter = 0
-        while iter < max_iter:
-        
-            # Set current node to lowest cost node in the open list
-            #! There is a faster way to do this, probably keeping a list sorted
-            #!  by f-value but this can be optimised later
-            iter_list = self.open_list.copy()
-            best_node = self.grid[iter_list.pop()]
-            if len(iter_list) != 0:
-                for node_index in iter_list:
-                    if self.grid[node_index].f_value < best_node.f_value:
-                        best_node = self.grid[node_index]
-            self.current_node = best_node
-            # Add current node to closed list
-            current_index = self._index_from_coordinate(self.current_node.position)
-            self.open_list.remove(current_index)
-            self.closed_list.add(current_index)
-            
-            # Check the neighbouring nodes and calculate their movement costs
-            self._update_neighbours()
-            
-            # If the current node is the end position then stop iterating
-            if self.grid[current_index].position == self.end_position:
-                break
-            # If the open list is empty there is no route to the destination
-            if len(self.open_list) == 0:
+        if mode == "jps":
+            self._set_start_end_positions(start_position, end_position)
+            # Kept on the grid so the number of nodes expanded can be inspected
+            self.jump_point_search = JumpPointSearch(self)
+            route = self.jump_point_search.find_route(start_position, end_position, max_iter)
+            self._record_nodes_expanded(self.jump_point_search.nodes_expanded)
+            return route
+        elif mode == "bidirectional":
+            self._set_start_end_positions(start_position, end_position)
+            # Kept on the grid so the number of nodes expanded can be inspected
+            self.bidirectional_search = BidirectionalSearch(self)
+            route = self.bidirectional_search.find_route(start_position, end_position, max_iter)
+            self._record_nodes_expanded(self.bidirectional_search.nodes_expanded)
+            return route
+        elif mode == "incremental":
+            self._set_start_end_positions(start_position, end_position)
+            # The planner is kept while the end stays the same, so only the start is moved
+            if self.incremental_planner is None or self.incremental_planner.end_position != end_position:
+                self.incremental_planner = DStarLite(self, start_position, end_position)
+            else:
+                self.incremental_planner.move_start(start_position)
+            route = self.incremental_planner.find_route(max_iter)
+            self._record_nodes_expanded(self.incremental_planner.nodes_expanded)
+            return route
+        elif mode == "anytime":
+            self._set_start_end_positions(start_position, end_position)
+            # Kept on the grid so the suboptimality bound can be inspected
+            self.anytime_search = AnytimeSearch(self)
+            route = self.anytime_search.find_route(start_position, end_position, max_iter, time_limit)
+            self._record_nodes_expanded(self.anytime_search.nodes_expanded)
+            return route
+        elif mode == "flow":
+            self._set_start_end_positions(start_position, end_position)
+            route = self.flow_field(end_position).route_from(start_position)
+            if len(route) == 0:
                 print("There exists no valid route to destination!")
-                break
-            
-            iter += 1
-            
+            return route
+        elif mode == "hierarchical":
+            self._set_start_end_positions(start_position, end_position)
+            if self.hierarchy is None:
+                self.build_hierarchy(self.sector_size)
+            route = self.hierarchy.find_route(start_position, end_position)
+            if len(route) == 0:
+                print("There exists no valid route to destination!")
+            return route
+        elif mode != "astar":
+            print(f"Search mode {mode} not recognised! Exiting...")
+            exit(2)
+        
+        # <<< 1) Set the start and end positions of the route >>>
+        phase_start = perf_counter()
+        self._set_start_end_positions(start_position, end_position)
+        self.search_heuristic = self._heuristic_function()
+        phase_start = self._record_phase("setup", phase_start)
+        
+        # <<< 2) Expand the lowest cost nodes until the destination is reached >>>
+        found = self._run_astar(max_iter)
+        phase_start = self._record_phase("search", phase_start)
+        # If max_iter ran out first, the end may have been reached by a route which is not
+        #  yet known to be the best, so no route is given rather than a worse one
+        if not found:
+            return []
             
         # <<< 3) Save the optimal route by tracing back through parent nodes >>>
-        end_index = self._index_from_coordinate(self.end_position)
-        current_node = self.grid[end_index]
-        route = []
-        while current_node.position != self.start_position:
-            route.insert(0, current_node.position)
-            current_node = current_node.parent
-        route.insert(0, self.start_position)
+        route = self._trace_route()
+        self._record_phase("trace", phase_start)
         return route
+    
+    #* >>> Method which finds many routes at once, spread over a pool of processes <<<
+    def find_routes(self, position_pairs: list[tuple[tuple[int]]], number_of_workers: int = None,
+                    max_iter: int = 10000) -> list[list[tuple]]:
+        """
+        Inputs:
+            + position_pairs -> A list of (start_position, end_position) pairs to find routes between
+            + number_of_workers -> The number of worker processes, defaults to the number of cores
+            + max_iter -> The maximum number of iterations for each route
+        Returns:
+            + The route for each pair, in the same order as position_pairs
+        """
+        
+        # Check every pair here, since a worker cannot exit the program
+        for start, end in position_pairs:
+            self._check_route_in_bounds(start, end)
+        
+        # Pairs with no possible route, or with a cached route, are answered here rather than sent to a worker
+        routes = [[] if not self._may_be_connected(start, end) else None for start, end in position_pairs]
+        if self.route_cache is not None:
+            for index, (start, end) in enumerate(position_pairs):
+                if routes[index] is None:
+                    routes[index] = self.route_cache.get(start, end, "astar")
+        pending = [index for index, route in enumerate(routes) if route is None]
+        if len(pending) == 0:
+            return routes
+        
+        # Share the wall bitmap with the workers rather than copying the grid to each one
+        if self.storage == "arrays":
+            wall_bits = self.grid.wall_bits
+        else:
+            wall_bits = np.packbits(self._wall_mask())
+        memory = shared_memory.SharedMemory(create=True, size=max(1, wall_bits.nbytes))
+        try:
+            np.ndarray(wall_bits.shape, dtype=np.uint8, buffer=memory.buf)[:] = wall_bits
+            
+            if number_of_workers is None:
+                number_of_workers = os.cpu_count() or 1
+            chunk_size = max(1, len(pending) // (4 * number_of_workers))
+            with Pool(number_of_workers, initializer=_initialise_route_worker,
+                      initargs=(memory.name, self.dimensions, wall_bits.shape, max_iter,
+                                self._worker_heuristic())) as pool:
+                found_routes = pool.map(_find_route_in_worker, [position_pairs[index] for index in pending],
+                                        chunksize=chunk_size)
+            for index, route in zip(pending, found_routes):
+                routes[index] = route
+                if self.route_cache is not None:
+                    self.route_cache.put(*position_pairs[index], "astar", route)
+        finally:
+            memory.close()
+            memory.unlink()
+        return routes
+    
+    # Helper function giving the heuristic used by find_routes workers. The octile distance
+    #  stands in for landmarks, which would otherwise be rebuilt in every worker, and gives
+    #  routes of the same optimal cost.
+    def _worker_heuristic(self) -> str:
+        return "octile" if self.heuristic == "alt" else self.heuristic
+
+
+#* >>> Worker process functions for Grid.find_routes <<<
+_worker_memory = None
+_worker_grid = None
+_worker_max_iter = None
+
+def _initialise_route_worker(memory_name: str, dimensions: tuple[int], wall_bits_shape: tuple[int],
+                             max_iter: int, heuristic: str) -> None:
+    """
+    Builds a grid in the worker process which reads its walls from shared memory.
+    The grid is reused for every route the worker is given.
+    """
+    global _worker_memory, _worker_grid, _worker_max_iter
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    wall_bits = np.ndarray(wall_bits_shape, dtype=np.uint8, buffer=_worker_memory.buf)
+    _worker_grid = Grid(dimensions, storage="arrays", track_components=False, heuristic=heuristic)
+    _worker_grid.grid = ArrayStorage(dimensions, wall_bits=wall_bits)
+    _worker_max_iter = max_iter
+
+def _find_route_in_worker(position_pair: tuple[tuple[int]]) -> list[tuple]:
+    # Exiting inside a worker would leave the pool waiting forever, so raise to the parent instead
+    for position in position_pair:
+        if not _worker_grid._check_coordinate_in_bounds(position):
+            raise ValueError(f"Position {position} placed out of bounds")
+    return _worker_grid.find_route(position_pair[0], position_pair[1], _worker_max_iter)
@@ -0,0 +1,154 @@
+"""
+Creation Date: 17/10/2026
+
+This file holds the cost of moves between nodes, which every search uses, and the
+heuristics used by the route-finding searches to estimate the remaining cost of a route.
+Each heuristic is called with two positions and returns the estimated cost of a route
+between them.
+"""
+import hashlib
+import os
+import numpy as np
+
+#* >>> Squared straight-line distance, the heuristic Node.calculate_cost has always used <<<
+def squared_euclidean_distance(a: tuple[int], b: tuple[int]) -> int:
+    """
+    Inputs:
+        + a, b -> The (x,y) coordinates to measure between
+    Returns:
+        + The squared straight-line distance, which can overestimate route costs
+    """
+    return (a[0] - b[0])**2 + (a[1] - b[1])**2
+
+#* >>> Cost model <<<
+# A move to any of the eight neighbouring nodes is allowed, including diagonal moves past
+#  the corner of a wall. Costs are ten times the distance moved, rounded to integers.
+ORTHOGONAL_COST = 10
+DIAGONAL_COST = 14
+UNREACHABLE = np.iinfo(np.int32).max # Cost of positions with no route, as held in int32 cost arrays
+
+# Cost of a single move by (dx,dy)
+def move_cost(dx: int, dy: int) -> int:
+    return DIAGONAL_COST if dx != 0 and dy != 0 else ORTHOGONAL_COST
+
+# Cost of a single move between neighbouring positions
+def step_cost(a: tuple[int], b: tuple[int]) -> int:
+    return ORTHOGONAL_COST if a[0] == b[0] or a[1] == b[1] else DIAGONAL_COST
+
+#* >>> Octile distance, the exact route cost between two positions when there are no walls <<<
+def octile_distance(a: tuple[int], b: tuple[int]) -> int:
+    """
+    Inputs:
+        + a, b -> The (x,y) coordinates to measure between
+    Returns:
+        + The cost of the cheapest route between the positions on a grid with no walls
+    """
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return ORTHOGONAL_COST * max(dx, dy) + (DIAGONAL_COST - ORTHOGONAL_COST) * min(dx, dy)
+
+
+class LandmarkHeuristic:
+    """
+    Class for the ALT heuristic (A*, landmarks and the triangle inequality). Exact route
+    costs from a few landmark positions to every position are precomputed. For any landmark L
+    the cost of a route from a to b is at least |d(L,a) - d(L,b)|, which is far tighter
+    than the octile distance when walls force routes to detour.
+    """
+    
+    #* >>> Constructor is called when heuristic object is instantiated <<<
+    def __init__(self, dimensions: tuple[int], distance_tables: np.ndarray) -> None:
+        """
+        Inputs:
+            + dimensions -> The dimensions of the grid in number of nodes (x_dimension, y_dimension)
+            + distance_tables -> Array of shape (number of nodes, number of landmarks) holding
+                                 the route cost from each landmark to each node
+        """
+        self.dimensions = dimensions
+        self.distance_tables = distance_tables
+        # Searches measure every node against the same end, so its row of costs is kept
+        self._cached_position = None
+        self._cached_costs = None
+        
+    #* >>> Chooses landmarks spread across the grid and finds the costs from each <<<
+    @classmethod
+    def build(cls, wall_mask: np.ndarray, dimensions: tuple[int], number_of_landmarks: int = 8,
+              cache_directory: str | None = None):
+        """
+        Inputs:
+            + wall_mask -> A flat array which is True at the grid index of every wall
+            + dimensions -> The dimensions of the grid in number of nodes (x_dimension, y_dimension)
+            + number_of_landmarks -> The number of landmarks, more give tighter estimates but use more memory
+            + cache_directory -> Where distance tables are saved under the hash of the walls, so later
+                                 builds for the same walls load them memory-mapped. None turns off caching.
+        Returns:
+            + The landmark heuristic for the grid
+        """
+        cache_path = None
+        if cache_directory is not None:
+            walls_hash = hashlib.sha256()
+            walls_hash.update(np.array([*dimensions, number_of_landmarks], dtype=np.int64).tobytes())
+            walls_hash.update(np.packbits(wall_mask).tobytes())
+            cache_path = os.path.join(cache_directory, walls_hash.hexdigest() + ".npy")
+            if os.path.exists(cache_path):
+                return cls(dimensions, np.load(cache_path, mmap_mode="r"))
+            
+        # Farthest-point selection: each landmark is the position furthest from all those
+        #  chosen so far, with unreachable positions counting as furthest of all so that
+        #  separate regions get landmarks of their own
+        distance_tables = np.zeros((len(wall_mask), number_of_landmarks), dtype=np.int32)
+        open_indices = np.flatnonzero(~wall_mask)
+        if len(open_indices) > 0:
+            nearest_landmark_costs = np.full(len(wall_mask), UNREACHABLE, dtype=np.int32)
+            # The first landmark is chosen furthest from an arbitrary open position
+            landmark_index = open_indices[0]
+            landmark_index = cls._furthest_index(cls._costs_from(wall_mask, dimensions, landmark_index),
+                                                 nearest_landmark_costs, wall_mask)
+            for landmark_number in range(number_of_landmarks):
+                costs = cls._costs_from(wall_mask, dimensions, landmark_index)
+                distance_tables[:, landmark_number] = costs
+                nearest_landmark_costs = np.minimum(nearest_landmark_costs, costs)
+                landmark_index = cls._furthest_index(nearest_landmark_costs, nearest_landmark_costs, wall_mask)
+                
+        if cache_path is not None:
+            os.makedirs(cache_directory, exist_ok=True)
+            # Write to a temporary file first so a partly written table is never read
+            temporary_path = cache_path + ".tmp.npy"
+            np.save(temporary_path, distance_tables)
+            os.replace(temporary_path, cache_path)
+            distance_tables = np.load(cache_path, mmap_mode="r")
+        return cls(dimensions, distance_tables)
+    
+    # Helper function giving the route cost from one grid index to every grid index
+    @staticmethod
+    def _costs_from(wall_mask: np.ndarray, dimensions: tuple[int], index: int) -> np.ndarray:
+        # Imported here since FlowField takes its move costs from this module
+        from FlowField import FlowField
+        # Route costs are symmetric between open positions, so the costs to a position are also the costs from it
+        return FlowField(wall_mask, dimensions, (index % dimensions[0], index // dimensions[0])).costs
+    
+    # Helper function giving the open grid index with the largest cost, where unreachable
+    #  positions are taken before any reachable one
+    @staticmethod
+    def _furthest_index(costs: np.ndarray, nearest_landmark_costs: np.ndarray, wall_mask: np.ndarray) -> int:
+        candidates = np.where(wall_mask | (nearest_landmark_costs == 0), -1, costs.astype(np.int64))
+        return int(np.argmax(candidates))
+    
+    #* >>> Returns the lower bound on the cost of a route between two positions <<<
+    def __call__(self, a: tuple[int], b: tuple[int]) -> int:
+        """
+        Inputs:
+            + a, b -> The (x,y) coordinates to measure between
+        Returns:
+            + The largest triangle inequality bound over all landmarks, or the octile distance if larger
+        """
+        if b != self._cached_position:
+            self._cached_position = b
+            self._cached_costs = self.distance_tables[b[1] * self.dimensions[0] + b[0]].tolist()
+        # With only a handful of landmarks, plain lists are quicker than numpy operations
+        a_costs = self.distance_tables[a[1] * self.dimensions[0] + a[0]].tolist()
+        bound = octile_distance(a, b)
+        for a_cost, b_cost in zip(a_costs, self._cached_costs):
+            # Landmarks which cannot reach both positions give no bound
+            if a_cost != UNREACHABLE and b_cost != UNREACHABLE and abs(a_cost - b_cost) > bound:
+                bound = abs(a_cost - b_cost)
+        return bound
@@ -0,0 +1,347 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for the hierarchical route finder (HPA*). The grid
+is split into square sectors, and the places where a route can cross between sectors are
+joined into a small abstract graph using costs cached within each sector. A long route is
+found by searching the abstract graph, and only the legs of the route that are used are
+then refined into grid nodes. Routes are near-optimal rather than optimal.
+"""
+import heapq
+from itertools import count
+from Heuristics import octile_distance, move_cost, ORTHOGONAL_COST, DIAGONAL_COST
+
+class Hierarchy:
+    """
+    Class which holds the sector abstraction of a Grid and searches it.
+    """
+    
+    #* >>> Constructor is called when hierarchy object is instantiated <<<
+    def __init__(self, grid, sector_size: int = 16) -> None:
+        """
+        Inputs:
+            + grid -> The Grid to build the abstraction over
+            + sector_size -> The width and height of each sector in nodes
+        """
+        self.grid = grid
+        self.sector_size = sector_size
+        self.number_of_sectors = (-(-grid.dimensions[0] // sector_size), -(-grid.dimensions[1] // sector_size))
+        
+        self.border_transitions = {} # (sector, sector) -> [(position, position, cost)] crossing between them
+        self.inter_edges = {} # Position -> {position in another sector: cost}
+        self.intra_edges = {} # Sector -> {position: {position in same sector: cost}}
+        self.sector_moves = {} # Sector -> moves available from each of its nodes
+        
+        for sector in self._all_sectors():
+            for border in self._borders(sector):
+                if border not in self.border_transitions:
+                    self._set_border(border, self._find_transitions(border))
+        for sector in self._all_sectors():
+            self._build_sector(sector)
+            
+    #* >>> Helper functions for sectors <<<
+    def _all_sectors(self) -> list[tuple[int]]:
+        return [(sx, sy) for sy in range(self.number_of_sectors[1]) for sx in range(self.number_of_sectors[0])]
+    
+    def _sector_of(self, position: tuple[int]) -> tuple[int]:
+        return (position[0] // self.sector_size, position[1] // self.sector_size)
+    
+    def _sector_bounds(self, sector: tuple[int]) -> tuple[int]:
+        # Returns (x_min, y_min, x_max, y_max), with the maximums excluded
+        return (sector[0] * self.sector_size, sector[1] * self.sector_size,
+                min((sector[0] + 1) * self.sector_size, self.grid.dimensions[0]),
+                min((sector[1] + 1) * self.sector_size, self.grid.dimensions[1]))
+    
+    def _borders(self, sector: tuple[int]) -> list[tuple[tuple[int]]]:
+        # Borders with the up to eight neighbouring sectors, each ordered so the first sector is smaller
+        borders = []
+        for dy in [-1,0,1]:
+            for dx in [-1,0,1]:
+                other = (sector[0] + dx, sector[1] + dy)
+                if (dx != 0 or dy != 0) and 0 <= other[0] < self.number_of_sectors[0] \
+                        and 0 <= other[1] < self.number_of_sectors[1]:
+                    borders.append(tuple(sorted([sector, other], key=lambda s: (s[1], s[0]))))
+        return borders
+    
+    def _traversable(self, position: tuple[int]) -> bool:
+        return self.grid._is_traversable(position)
+    
+    #* >>> Finds every place a route can cross a border <<<
+    def _find_transitions(self, border: tuple[tuple[int]]) -> list[tuple]:
+        """
+        Returns:
+            + (position, position, cost) pairs where a route may cross the border. A run of
+              straight crossings, which are connected on both sides, gets one pair in its
+              middle. Diagonal crossings which are not covered by a run get their own pair.
+        """
+        first, second = border
+        dx, dy = second[0] - first[0], second[1] - first[1]
+        x_min, y_min, x_max, y_max = self._sector_bounds(first)
+        
+        # Sectors which only meet at a corner are crossed by a single diagonal move
+        if dx != 0 and dy != 0:
+            a = (x_max - 1 if dx > 0 else x_min, y_max - 1)
+            b = (a[0] + dx, a[1] + 1)
+            return [(a, b, DIAGONAL_COST)] if self._traversable(a) and self._traversable(b) else []
+        
+        # Positions along the border on the first sector's side, and the step across it
+        if dx != 0:
+            along = [(x_max - 1, y) for y in range(y_min, y_max)]
+            across, sideways = (1, 0), (0, 1)
+        else:
+            along = [(x, y_max - 1) for x in range(x_min, x_max)]
+            across, sideways = (0, 1), (1, 0)
+        
+        def other_side(position, shift):
+            return (position[0] + across[0] + shift * sideways[0], position[1] + across[1] + shift * sideways[1])
+        
+        straight = [self._traversable(a) and self._traversable(other_side(a, 0)) for a in along]
+        transitions = []
+        run_start = None
+        for index in range(len(along) + 1):
+            if index < len(along) and straight[index]:
+                if run_start is None:
+                    run_start = index
+            elif run_start is not None:
+                middle = along[(run_start + index - 1) // 2]
+                transitions.append((middle, other_side(middle, 0), ORTHOGONAL_COST))
+                run_start = None
+                
+        # Diagonal crossings, only needed if the two ends are not part of the same run
+        run_ids = []
+        run_id = 0
+        for index in range(len(along)):
+            if straight[index] and (index == 0 or not straight[index - 1]):
+                run_id += 1
+            run_ids.append(run_id if straight[index] else None)
+        for index, a in enumerate(along):
+            if not self._traversable(a):
+                continue
+            for shift in [-1,1]:
+                if not 0 <= index + shift < len(along):
+                    continue
+                b = other_side(a, shift)
+                if not self._traversable(b):
+                    continue
+                if run_ids[index] is not None and run_ids[index] == run_ids[index + shift]:
+                    continue
+                transitions.append((a, b, DIAGONAL_COST))
+        return transitions
+    
+    def _set_border(self, border: tuple[tuple[int]], transitions: list[tuple]) -> None:
+        # Swap the inter-sector edges of a border for a new set
+        for a, b, _ in self.border_transitions.get(border, []):
+            for position, other in [(a, b), (b, a)]:
+                edges = self.inter_edges.get(position)
+                if edges is not None:
+                    edges.pop(other, None)
+                    if len(edges) == 0:
+                        del self.inter_edges[position]
+        self.border_transitions[border] = transitions
+        for a, b, cost in transitions:
+            self.inter_edges.setdefault(a, {})[b] = cost
+            self.inter_edges.setdefault(b, {})[a] = cost
+            
+    #* >>> Searches within one sector <<<
+    def _sector_moves(self, sector: tuple[int]) -> list[list[tuple[int]]]:
+        """
+        Returns:
+            + For each node of the sector, by index local to the sector, the (index, cost) of
+              every traversable neighbour inside the sector. Cached until the sector changes.
+        """
+        moves = self.sector_moves.get(sector)
+        if moves is not None:
+            return moves
+        x_min, y_min, x_max, y_max = self._sector_bounds(sector)
+        width, height = x_max - x_min, y_max - y_min
+        passable = [self._traversable((x, y)) for y in range(y_min, y_max) for x in range(x_min, x_max)]
+        moves = []
+        for index in range(width * height):
+            x, y = index % width, index // width
+            node_moves = []
+            for dy in [-1,0,1]:
+                for dx in [-1,0,1]:
+                    if (dx != 0 or dy != 0) and 0 <= x + dx < width and 0 <= y + dy < height \
+                            and passable[index + dx + dy * width]:
+                        node_moves.append((index + dx + dy * width, move_cost(dx, dy)))
+            moves.append(node_moves)
+        self.sector_moves[sector] = moves
+        return moves
+    
+    def _sector_search(self, source: tuple[int], sector: tuple[int], targets: set | None = None,
+                       find_parents: bool = False) -> tuple[dict]:
+        """
+        Inputs:
+            + source -> The position to search from
+            + sector -> The sector the search may not leave
+            + targets -> If given, the search stops once all of these positions are reached
+            + find_parents -> If True the parent of each position is also returned
+        Returns:
+            + The cost of reaching each position from the source, and the parent of each
+              position if asked for
+        """
+        x_min, y_min, x_max, y_max = self._sector_bounds(sector)
+        width, height = x_max - x_min, y_max - y_min
+        moves = self._sector_moves(sector)
+        
+        # Search over indices local to the sector
+        source_index = (source[0] - x_min) + (source[1] - y_min) * width
+        remaining = None
+        if targets is not None:
+            remaining = {(x - x_min) + (y - y_min) * width for x, y in targets}
+        costs = {source_index: 0}
+        parents = {source_index: None}
+        closed = set()
+        heap = [(0, source_index)]
+        while heap:
+            cost, index = heapq.heappop(heap)
+            if index in closed:
+                continue
+            closed.add(index)
+            if remaining is not None:
+                remaining.discard(index)
+                if len(remaining) == 0:
+                    break
+            for neighbour, move_cost in moves[index]:
+                new_cost = cost + move_cost
+                if neighbour not in closed and new_cost < costs.get(neighbour, new_cost + 1):
+                    costs[neighbour] = new_cost
+                    parents[neighbour] = index
+                    heapq.heappush(heap, (new_cost, neighbour))
+                    
+        def position(index):
+            return (x_min + index % width, y_min + index // width)
+        position_costs = {position(index): cost for index, cost in costs.items()}
+        if not find_parents:
+            return position_costs, None
+        position_parents = {position(index): None if parent is None else position(parent)
+                            for index, parent in parents.items()}
+        return position_costs, position_parents
+    
+    def _build_sector(self, sector: tuple[int]) -> None:
+        # Cache the cost between every pair of transition positions inside the sector
+        positions = set()
+        for border in self._borders(sector):
+            for a, b, _ in self.border_transitions[border]:
+                for position in (a, b):
+                    if self._sector_of(position) == sector:
+                        positions.add(position)
+        # Costs are the same in both directions, so each search only needs the positions
+        #  not already searched from
+        edges = {position: {} for position in positions}
+        remaining = set(positions)
+        for position in sorted(positions):
+            remaining.discard(position)
+            if len(remaining) == 0:
+                break
+            costs, _ = self._sector_search(position, sector, remaining)
+            for other in remaining:
+                if other in costs:
+                    edges[position][other] = costs[other]
+                    edges[other][position] = costs[other]
+        self.intra_edges[sector] = edges
+        
+    #* >>> Rebuilds the parts of the abstraction affected by a wall being added or removed <<<
+    def update_wall(self, position: tuple[int]) -> None:
+        """
+        Inputs:
+            + position -> The (x,y) coordinate where a wall was added or removed
+        """
+        sector = self._sector_of(position)
+        self.sector_moves.pop(sector, None)
+        x_min, y_min, x_max, y_max = self._sector_bounds(sector)
+        affected_sectors = {sector}
+        # Borders only change if the position is at the edge of its sector
+        for border in self._borders(sector):
+            other = border[1] if border[0] == sector else border[0]
+            dx, dy = other[0] - sector[0], other[1] - sector[1]
+            on_edge_x = dx == 0 or (dx < 0 and position[0] == x_min) or (dx > 0 and position[0] == x_max - 1)
+            on_edge_y = dy == 0 or (dy < 0 and position[1] == y_min) or (dy > 0 and position[1] == y_max - 1)
+            if on_edge_x and on_edge_y:
+                self._set_border(border, self._find_transitions(border))
+                affected_sectors.add(other)
+        for affected_sector in affected_sectors:
+            self._build_sector(affected_sector)
+            
+    #* >>> Method which finds a route between start and end positions <<<
+    def find_route(self, start_position: tuple[int], end_position: tuple[int]) -> list[tuple]:
+        """
+        Inputs:
+            + start_position -> The grid coordinate of the route's starting point
+            + end_position -> The grid coordinate of the route's ending point
+        Returns:
+            + Coordinates of nodes in the route, ordered from start node to end node.
+              This is empty if no route exists.
+        """
+        if not self._traversable(end_position):
+            return []
+        if start_position == end_position:
+            return [start_position]
+        start_sector = self._sector_of(start_position)
+        end_sector = self._sector_of(end_position)
+        
+        # Join the start and end to the transitions of their sectors
+        start_costs, _ = self._sector_search(start_position, start_sector)
+        start_edges = {position: start_costs[position] for position in self.intra_edges[start_sector]
+                       if position in start_costs and position != start_position}
+        if end_position in start_costs:
+            start_edges[end_position] = start_costs[end_position]
+        end_costs, _ = self._sector_search(end_position, end_sector)
+        
+        def neighbours(position):
+            if position == start_position:
+                edges = dict(start_edges)
+            else:
+                edges = dict(self.intra_edges[self._sector_of(position)].get(position, {}))
+                # The end can be reached from any transition in its sector
+                if self._sector_of(position) == end_sector and position in end_costs:
+                    edges[end_position] = end_costs[position]
+            for other, cost in self.inter_edges.get(position, {}).items():
+                edges[other] = min(cost, edges.get(other, cost))
+            return edges.items()
+        
+        # A* over the abstract graph with the octile distance as heuristic
+        g_values = {start_position: 0}
+        parents = {start_position: None}
+        closed = set()
+        insertion_counter = count()
+        heap = [(octile_distance(start_position, end_position), next(insertion_counter), start_position)]
+        while heap:
+            _, _, position = heapq.heappop(heap)
+            if position in closed:
+                continue
+            closed.add(position)
+            if position == end_position:
+                break
+            for other, cost in neighbours(position):
+                g_value = g_values[position] + cost
+                if other not in closed and g_value < g_values.get(other, g_value + 1):
+                    g_values[other] = g_value
+                    parents[other] = position
+                    heapq.heappush(heap, (g_value + octile_distance(other, end_position), next(insertion_counter), other))
+        if end_position not in closed:
+            return []
+        
+        abstract_route = []
+        position = end_position
+        while position is not None:
+            abstract_route.insert(0, position)
+            position = parents[position]
+        return self._refine(abstract_route)
+    
+    #* >>> Turns a route over the abstract graph into grid nodes <<<
+    def _refine(self, abstract_route: list[tuple]) -> list[tuple]:
+        route = [abstract_route[0]]
+        for position, next_position in zip(abstract_route, abstract_route[1:]):
+            if self._sector_of(position) != self._sector_of(next_position):
+                # Crossing a border is a single move
+                route.append(next_position)
+                continue
+            _, parents = self._sector_search(position, self._sector_of(position), {next_position}, True)
+            leg = []
+            step = next_position
+            while step != position:
+                leg.insert(0, step)
+                step = parents[step]
+            route.extend(leg)
+        return route
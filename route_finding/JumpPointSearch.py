@@ -0,0 +1,220 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for jump point search. On uniform-cost grids many
+routes of equal cost exist between two nodes, and plain A* expands all of them. Jump point
+search only expands the nodes where a route may need to turn (jump points), jumping along
+straight and diagonal lines in between, while still finding a route of optimal cost.
+Its pruning rules assume diagonal moves may cut past wall corners, as in the cost model
+of Heuristics.py.
+"""
+import heapq
+from itertools import count
+import numpy as np
+from Heuristics import octile_distance
+
+class JumpPointSearch:
+    """
+    Class which runs jump point search over the walls of a Grid.
+    """
+    
+    #* >>> Constructor is called when search object is instantiated <<<
+    def __init__(self, grid) -> None:
+        """
+        Inputs:
+            + grid -> The Grid to search, only its walls and dimensions are used
+        """
+        self.grid = grid
+        self.nodes_expanded = 0 # Number of jump points expanded by the last search
+        
+        # Walls with a border of walls around the grid, as bytes indexed by
+        #  (y + 1) * (width + 2) + (x + 1), so moving off the grid reads as a wall
+        width, height = grid.dimensions
+        self.padded_width = width + 2
+        walls = grid._search_arrays().wall_mask().reshape(height, width)
+        padded = np.ones((height + 2, width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = walls
+        self.padded_walls = padded.tobytes()
+        
+        # Straight jumps stop at the first wall or node with a forced neighbour. For each
+        #  direction these stops are held with rows along the direction of travel, so the
+        #  nodes ahead of a jump are one contiguous slice.
+        above, below, middle = padded[:-2], padded[2:], padded[1:-1]
+        east = (above[:, 1:-1] & ~above[:, 2:]) | (below[:, 1:-1] & ~below[:, 2:])
+        west = (above[:, 1:-1] & ~above[:, :-2]) | (below[:, 1:-1] & ~below[:, :-2])
+        south = (middle[:, 2:] & ~below[:, 2:]) | (middle[:, :-2] & ~below[:, :-2])
+        north = (middle[:, 2:] & ~above[:, 2:]) | (middle[:, :-2] & ~above[:, :-2])
+        self.stops = {(1, 0): np.ascontiguousarray(east | walls),
+                      (-1, 0): np.ascontiguousarray((west | walls)[:, ::-1]),
+                      (0, 1): np.ascontiguousarray((south | walls).T),
+                      (0, -1): np.ascontiguousarray((north | walls).T[:, ::-1])}
+        
+    # Helper function to check a coordinate can be moved to
+    def _traversable(self, x: int, y: int) -> bool:
+        return not self.padded_walls[(y + 1) * self.padded_width + x + 1]
+    
+    #* >>> Returns the directions worth searching from a node reached travelling in a direction <<<
+    def _pruned_directions(self, x: int, y: int, direction: tuple[int] | None) -> list[tuple[int]]:
+        """
+        Inputs:
+            + x, y -> The coordinate of the node
+            + direction -> The (dx,dy) step from the node's parent, None for the start node
+        Returns:
+            + The natural and forced directions from the node
+        """
+        if direction is None:
+            return [(dx, dy) for dx in [-1,0,1] for dy in [-1,0,1] if dx != 0 or dy != 0]
+        
+        dx, dy = direction
+        if dx != 0 and dy != 0:
+            directions = [(dx, 0), (0, dy), (dx, dy)]
+            if not self._traversable(x - dx, y):
+                directions.append((-dx, dy))
+            if not self._traversable(x, y - dy):
+                directions.append((dx, -dy))
+        elif dx != 0:
+            directions = [(dx, 0)]
+            if not self._traversable(x, y + 1):
+                directions.append((dx, 1))
+            if not self._traversable(x, y - 1):
+                directions.append((dx, -1))
+        else:
+            directions = [(0, dy)]
+            if not self._traversable(x + 1, y):
+                directions.append((1, dy))
+            if not self._traversable(x - 1, y):
+                directions.append((-1, dy))
+        return directions
+    
+    #* >>> Moves from a node in a straight line until reaching a jump point <<<
+    def _jump_straight(self, x: int, y: int, dx: int, dy: int) -> tuple[int] | None:
+        """
+        Inputs:
+            + x, y -> The coordinate to jump from
+            + dx, dy -> The orthogonal direction to jump in
+        Returns:
+            + The coordinate of the next jump point, or None if a wall or the edge is hit first
+        """
+        width, height = self.grid.dimensions
+        # The nodes ahead of (x,y), in the order they are reached
+        if dx == 1:
+            ahead = self.stops[(1, 0)][y, x + 1:]
+        elif dx == -1:
+            ahead = self.stops[(-1, 0)][y, width - x:]
+        elif dy == 1:
+            ahead = self.stops[(0, 1)][x, y + 1:]
+        else:
+            ahead = self.stops[(0, -1)][x, height - y:]
+        steps = int(ahead.argmax()) + 1 if len(ahead) > 0 else 1
+        if len(ahead) == 0 or not ahead[steps - 1]:
+            # No stop before the edge of the grid, which is reached one step past the last node
+            steps = len(ahead) + 1
+            
+        # The end may lie on the line before the stop
+        end_x, end_y = self.end_position
+        if (dx != 0 and end_y == y and 0 < (end_x - x) * dx < steps) or \
+           (dy != 0 and end_x == x and 0 < (end_y - y) * dy < steps):
+            return self.end_position
+        x, y = x + dx * steps, y + dy * steps
+        if not self._traversable(x, y):
+            return None
+        return (x, y)
+    
+    #* >>> Moves from a node in a direction until reaching a jump point <<<
+    def _jump(self, x: int, y: int, dx: int, dy: int) -> tuple[int] | None:
+        """
+        Inputs:
+            + x, y -> The coordinate to jump from
+            + dx, dy -> The direction to jump in
+        Returns:
+            + The coordinate of the next jump point, or None if a wall or the edge is hit first
+        """
+        if dx == 0 or dy == 0:
+            return self._jump_straight(x, y, dx, dy)
+        
+        # Diagonal jumps go one node at a time, since each node may start a straight jump
+        while True:
+            x += dx
+            y += dy
+            if not self._traversable(x, y):
+                return None
+            if (x, y) == self.end_position:
+                return (x, y)
+            
+            # A node with a forced neighbour is a jump point
+            if (not self._traversable(x - dx, y) and self._traversable(x - dx, y + dy)) or \
+               (not self._traversable(x, y - dy) and self._traversable(x + dx, y - dy)):
+                return (x, y)
+            # So is a node from which a straight jump finds a jump point
+            if self._jump_straight(x, y, dx, 0) is not None or self._jump_straight(x, y, 0, dy) is not None:
+                return (x, y)
+                
+    #* >>> Method which finds the shortest route between start and end positions <<<
+    def find_route(self, start_position: tuple[int], end_position: tuple[int],
+                   max_iter: int = 10000) -> list[tuple]:
+        """
+        Inputs:
+            + start_position -> The grid coordinate of the route's starting point
+            + end_position -> The grid coordinate of the route's ending point
+            + max_iter -> The maximum number of jump points that will be expanded
+        Returns:
+            + Coordinates of every node in the optimal route, ordered from start node to end node.
+              This is empty if no route was found.
+        """
+        self.end_position = end_position
+        self.nodes_expanded = 0
+        
+        g_values = {start_position: 0}
+        parents = {start_position: None}
+        closed_list = set()
+        insertion_counter = count()
+        open_heap = [(octile_distance(start_position, end_position), 0, next(insertion_counter),
+                      start_position)]
+        
+        while open_heap and self.nodes_expanded < max_iter:
+            _, _, _, current = heapq.heappop(open_heap)
+            if current in closed_list:
+                continue
+            closed_list.add(current)
+            self.nodes_expanded += 1
+            if current == end_position:
+                return self._expand_route(parents, end_position)
+            
+            # Direction travelled from the parent, as a unit step
+            parent = parents[current]
+            direction = None
+            if parent is not None:
+                direction = ((current[0] > parent[0]) - (current[0] < parent[0]),
+                             (current[1] > parent[1]) - (current[1] < parent[1]))
+            
+            for dx, dy in self._pruned_directions(current[0], current[1], direction):
+                jump_point = self._jump(current[0], current[1], dx, dy)
+                if jump_point is None or jump_point in closed_list:
+                    continue
+                g_value = g_values[current] + octile_distance(current, jump_point)
+                if jump_point not in g_values or g_value < g_values[jump_point]:
+                    g_values[jump_point] = g_value
+                    parents[jump_point] = current
+                    h_value = octile_distance(jump_point, end_position)
+                    heapq.heappush(open_heap, (g_value + h_value, h_value, next(insertion_counter), jump_point))
+                    
+        if not open_heap:
+            print("There exists no valid route to destination!")
+        return []
+    
+    #* >>> Fills in the nodes between jump points to give the full route <<<
+    def _expand_route(self, parents: dict, end_position: tuple[int]) -> list[tuple]:
+        jump_points = []
+        current = end_position
+        while current is not None:
+            jump_points.insert(0, current)
+            current = parents[current]
+            
+        route = [jump_points[0]]
+        for next_point in jump_points[1:]:
+            x, y = route[-1]
+            while (x, y) != next_point:
+                x += (next_point[0] > x) - (next_point[0] < x)
+                y += (next_point[1] > y) - (next_point[1] < y)
+                route.append((x, y))
+        return route
@@ -0,0 +1,76 @@
+"""
+Creation Date: 17/10/2026
+
+This file loads maps and scenarios in the MovingAI benchmark formats
+(https://movingai.com/benchmarks/formats.html) so routes can be found on standard maps.
+
+The benchmark's optimal lengths assume diagonal moves cost sqrt(2) and may not cut past
+walls, whereas Grid uses costs of 10 and 14 and allows diagonal moves past walls. The
+lengths are kept for reference but will not match Grid route costs exactly.
+"""
+from typing import NamedTuple
+
+# Map characters which can be moved through, all others are walls. These are ground ('.'
+#  and 'G') and swamp ('S'), while out of bounds, trees and water are not traversable.
+PASSABLE_TERRAIN = ".GS"
+
+class Scenario(NamedTuple):
+    bucket: int # Queries are grouped into buckets of similar optimal length
+    map_name: str
+    dimensions: tuple[int]
+    start_position: tuple[int]
+    end_position: tuple[int]
+    optimal_length: float # The optimal length under the benchmark's own movement rules
+
+#* >>> Reads a .map file into grid dimensions and wall positions <<<
+def load_map(path: str) -> tuple[tuple[int], list[tuple[int]]]:
+    """
+    Inputs:
+        + path -> The path to the .map file
+    Returns:
+        + The dimensions of the map (x_dimension, y_dimension) and the (x,y) coordinates
+          of its walls, ready to be passed to Grid
+    """
+    with open(path) as map_file:
+        header = {}
+        for line in map_file:
+            line = line.strip()
+            if line == "map":
+                break
+            if line:
+                key, value = line.split(maxsplit=1)
+                header[key] = value
+        else:
+            raise ValueError(f"{path} has no map section")
+        if header.get("type") != "octile":
+            raise ValueError(f"{path} has map type {header.get('type')}, only octile maps are supported")
+        width, height = int(header["width"]), int(header["height"])
+        
+        rows = [line.rstrip("\r\n") for line in map_file][:height]
+    if len(rows) != height or any(len(row) < width for row in rows):
+        raise ValueError(f"{path} does not have {height} rows of {width} characters")
+    
+    wall_positions = [(x, y) for y, row in enumerate(rows) for x, terrain in enumerate(row[:width])
+                      if terrain not in PASSABLE_TERRAIN]
+    return (width, height), wall_positions
+
+#* >>> Reads a .scen file into a list of scenarios <<<
+def load_scenarios(path: str) -> list[Scenario]:
+    """
+    Inputs:
+        + path -> The path to the .scen file
+    Returns:
+        + Every scenario in the file, in file order
+    """
+    scenarios = []
+    with open(path) as scenario_file:
+        for line in scenario_file:
+            fields = line.split()
+            # Skip the version line and any blank lines
+            if len(fields) != 9:
+                continue
+            bucket, map_name, width, height, start_x, start_y, end_x, end_y, optimal_length = fields
+            scenarios.append(Scenario(int(bucket), map_name, (int(width), int(height)),
+                                      (int(start_x), int(start_y)), (int(end_x), int(end_y)),
+                                      float(optimal_length)))
+    return scenarios
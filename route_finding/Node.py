@@ -7,7 +7,8 @@ A node represents a position that can be moved to,
 for example a square on a map grid.
 """
 
-from typing import TypeVar
+from typing import Callable, TypeVar
+from Heuristics import squared_euclidean_distance, step_cost
 
 nodetype = TypeVar("nodetype", bound="Node")
 
@@ -28,6 +29,7 @@ class Node:
         self.position = position
         self.traversable = traversable
         self.parent = None # This will be updated later
+        self.search_id = None # The search which last reached this node
         
         #* >>> Cell cost values <<<
         # The total cost value of the cell, f = g + h
@@ -38,11 +40,13 @@ class Node:
         self.g_value = None
     
     #* >>> This method updates the cost of the node given its parent and the end position <<<
-    def calculate_cost(self, parent: nodetype, end_position: tuple[int]) -> None:
+    def calculate_cost(self, parent: nodetype, end_position: tuple[int],
+                       heuristic: Callable[[tuple, tuple], int] = squared_euclidean_distance) -> None:
         """
         Inputs:
             + parent       -> The parent node
             + end_position -> The (x,y) coordinate specifying the position of the end node
+            + heuristic    -> Function estimating the cost between two positions, see Heuristics.py
             
         """
         
@@ -51,9 +55,8 @@ class Node:
         # Update the g-value.
         self.g_value = self._calculate_g_value(self.parent)
         
-        # Update the h-value, which we do via straight-line distance
-        self.h_value = (end_position[0] - self.position[0])**2 \
-                        + (end_position[1] - self.position[1])**2
+        # Update the h-value, which by default is the squared straight-line distance
+        self.h_value = heuristic(self.position, end_position)
                         
         # Update the f-value
         self.f_value = self.g_value + self.h_value
@@ -67,17 +70,16 @@ class Node:
             + The g-cost value of the node
         """
         
-        #We add 10 for orthogonal movement and 14 for diagonal.
-        if parent.position[0] == self.position[0] or parent.position[1] == self.position[1]:
-            return parent.g_value + 10
-        else:
-            return parent.g_value + 14
+        # Moves cost 10 orthogonally and 14 diagonally, see Heuristics.py
+        return parent.g_value + step_cost(parent.position, self.position)
         
     #* >>> This method updates the parent node if a more optimal choice appears <<<
-    def check_new_parent(self, new_parent: nodetype) -> None:
+    def check_new_parent(self, new_parent: nodetype) -> bool:
         """
         Inputs:
             + new_parent -> Parent node which may provide more optimal route
+        Returns:
+            + True if the new parent was taken, meaning the node's f-value has dropped
         """
         
         current_g_value = self.g_value
@@ -85,6 +87,78 @@ class Node:
         
         # If path to this node is more optimal via the new parent then update its values
         if current_g_value > new_g_value:
+            # The f-value is set first, since a view's h-value is found from its g-value
             self.parent = new_parent
+            self.f_value = self.h_value + new_g_value
             self.g_value = new_g_value
-            self.f_value = self.h_value + self.g_value
+            return True
+        return False
+
+
+class NodeView(Node):
+    """
+    Class which presents one entry of an ArrayStorage as a node. The node's values
+    live in the storage's flat arrays, so views are cheap to create and discard.
+    """
+    
+    #* >>> Constructor is called when node view is instantiated <<<
+    def __init__(self, storage, index: int) -> None:
+        """
+        Inputs:
+            + storage -> The ArrayStorage holding the node's values
+            + index -> The 1D grid index of the node
+        """
+        self.storage = storage
+        self.index = index
+        
+    @property
+    def position(self) -> tuple[int]:
+        return (self.index % self.storage.dimensions[0], self.index // self.storage.dimensions[0])
+    
+    @property
+    def traversable(self) -> bool:
+        return not self.storage.is_wall(self.index)
+    
+    @property
+    def parent(self) -> nodetype | None:
+        parent_index = self.storage.get_parent(self.index)
+        return None if parent_index is None else NodeView(self.storage, parent_index)
+    
+    @parent.setter
+    def parent(self, parent: nodetype | None) -> None:
+        self.storage.set_parent(self.index, None if parent is None else parent.index)
+        
+    @property
+    def g_value(self) -> int | None:
+        return self.storage.get_g_value(self.index)
+    
+    @g_value.setter
+    def g_value(self, g_value: int | None) -> None:
+        self.storage.set_g_value(self.index, g_value)
+        
+    # The h-value is always f - g, so it is not stored separately
+    @property
+    def h_value(self) -> int | None:
+        g_value, f_value = self.g_value, self.f_value
+        return None if g_value is None or f_value is None else f_value - g_value
+    
+    @h_value.setter
+    def h_value(self, h_value: int | None) -> None:
+        if h_value is not None and self.g_value is not None:
+            self.f_value = self.g_value + h_value
+        
+    @property
+    def f_value(self) -> int | None:
+        return self.storage.get_f_value(self.index)
+    
+    @f_value.setter
+    def f_value(self, f_value: int | None) -> None:
+        self.storage.set_f_value(self.index, f_value)
+        
+    @property
+    def search_id(self) -> int | None:
+        return self.storage.get_search_id(self.index)
+    
+    @search_id.setter
+    def search_id(self, search_id: int | None) -> None:
+        self.storage.set_search_id(self.index, search_id)
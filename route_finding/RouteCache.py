@@ -0,0 +1,109 @@
+"""
+Creation Date: 17/10/2026
+
+This file contains the class definition for the route cache. Routes are kept for the most
+recently requested (start, end) pairs and the least recently used is dropped when the cache
+is full. Any suffix of an optimal route is itself optimal, so searches which give optimal
+routes are also answered from any cached route to the same end that passes through the start.
+"""
+from collections import OrderedDict
+from Heuristics import octile_distance, step_cost
+
+# Search modes of Grid.find_route whose routes are always of optimal cost
+OPTIMAL_MODES = ("jps", "bidirectional", "incremental", "flow")
+
+class RouteCache:
+    """
+    Class which holds a bounded number of routes, invalidating them as walls change.
+    """
+    
+    #* >>> Constructor is called when cache object is instantiated <<<
+    def __init__(self, max_routes: int) -> None:
+        """
+        Inputs:
+            + max_routes -> The most routes held before the least recently used is dropped
+        """
+        self.max_routes = max_routes
+        self.hits = 0
+        self.misses = 0
+        
+        # Cached routes by (start, end, mode), ordered from least to most recently used,
+        #  along with each route's cost and bounding box
+        self.routes = OrderedDict()
+        self.costs = {}
+        self.bounding_boxes = {}
+        # Key of a cached optimal route passing through each (position, end, mode), so suffixes can be found
+        self.suffix_index = {}
+        
+    #* >>> Returns a cached route, or None if there isn't one <<<
+    def get(self, start_position: tuple[int], end_position: tuple[int], mode: str) -> list[tuple]:
+        key = (start_position, end_position, mode)
+        if key in self.routes:
+            self.hits += 1
+            self.routes.move_to_end(key)
+            return list(self.routes[key])
+        if mode in OPTIMAL_MODES and key in self.suffix_index:
+            self.hits += 1
+            containing_key = self.suffix_index[key]
+            self.routes.move_to_end(containing_key)
+            route = self.routes[containing_key]
+            return route[route.index(start_position):]
+        self.misses += 1
+        return None
+    
+    #* >>> Stores a route, dropping the least recently used route if the cache is full <<<
+    def put(self, start_position: tuple[int], end_position: tuple[int], mode: str, route: list[tuple]) -> None:
+        # Empty routes are not kept, since removing a wall anywhere could open a route
+        if len(route) == 0 or self.max_routes <= 0:
+            return
+        key = (start_position, end_position, mode)
+        if key in self.routes:
+            self._remove(key)
+        while len(self.routes) >= self.max_routes:
+            self._remove(next(iter(self.routes)))
+            
+        self.routes[key] = list(route)
+        self.costs[key] = sum(step_cost(a, b) for a, b in zip(route, route[1:]))
+        x_values = [position[0] for position in route]
+        y_values = [position[1] for position in route]
+        self.bounding_boxes[key] = (min(x_values), min(y_values), max(x_values), max(y_values))
+        if mode in OPTIMAL_MODES:
+            for position in route[1:]:
+                self.suffix_index[(position, end_position, mode)] = key
+                
+    #* >>> Drops a route and its suffix entries from the cache <<<
+    def _remove(self, key: tuple) -> None:
+        route = self.routes.pop(key)
+        del self.costs[key]
+        del self.bounding_boxes[key]
+        for position in route[1:]:
+            suffix_key = (position, key[1], key[2])
+            if self.suffix_index.get(suffix_key) == key:
+                del self.suffix_index[suffix_key]
+                
+    #* >>> Drops every route which may have changed after a wall was placed or removed <<<
+    def update_wall(self, wall_position: tuple[int], wall_added: bool) -> None:
+        """
+        Inputs:
+            + wall_position -> The (x,y) coordinate whose wall has changed
+            + wall_added -> True if a wall was placed, False if one was removed
+        """
+        x, y = wall_position
+        for key in list(self.routes):
+            if wall_added:
+                # A new wall only blocks routes which pass through it
+                x_min, y_min, x_max, y_max = self.bounding_boxes[key]
+                if x_min <= x <= x_max and y_min <= y <= y_max and wall_position in self.routes[key]:
+                    self._remove(key)
+            else:
+                # A removed wall only matters if a route through it could be cheaper, which
+                #  the octile distances either side of it bound from below
+                if octile_distance(key[0], wall_position) + octile_distance(wall_position, key[1]) < self.costs[key]:
+                    self._remove(key)
+                    
+    #* >>> Drops every route <<<
+    def clear(self) -> None:
+        self.routes.clear()
+        self.costs.clear()
+        self.bounding_boxes.clear()
+        self.suffix_index.clear()
@@ -0,0 +1,14 @@
+"""
+Creation Date: 17/10/2026
+
+Regression checks for the array node storage. Run with pytest from this directory.
+"""
+from Grid import Grid
+
+#* >>> Costs on wide grids must not overflow the storage arrays <<<
+def test_wide_grid_route():
+    # The squared distance heuristic between the corners is above 2**31
+    grid = Grid((70000, 3), storage="arrays", track_components=False)
+    route = grid.find_route((0, 0), (69999, 2), max_iter=10**6)
+    assert route[0] == (0, 0) and route[-1] == (69999, 2)
+    assert len(route) == 70000
@@ -0,0 +1,19 @@
+"""
+Creation Date: 17/10/2026
+
+Regression checks for grid searches. Run with pytest from this directory.
+"""
+from time import perf_counter
+from Grid import Grid
+
+#* >>> A* searches over large grids must not spend long on each expanded node <<<
+def test_large_grid_search_time():
+    # A wall across all but the last row forces nearly 400,000 expansions, which took
+    #  over 20 seconds when every node reached was a Node object
+    walls = [(500, y) for y in range(999)]
+    grid = Grid((1000, 1000), walls, storage="arrays", heuristic="octile", track_components=False)
+    search_start = perf_counter()
+    route = grid.find_route((0, 500), (999, 500), max_iter=10**6)
+    assert perf_counter() - search_start < 12
+    assert route[0] == (0, 500) and route[-1] == (999, 500)
+    assert (500, 999) in route